@@ -1,10 +1,11 @@
-from pathlib import Path
-import yaml
+from src.enrichment import enriched_output_path, load_config
 from src.sheet_sync import SheetSync
 
-cfg = yaml.safe_load(open(Path('config/settings.yaml')))
-webhook = cfg['google_sheets']['webhook_url']
-csv_path = "data/enriched_with_emails.csv"  
-syncer = SheetSync(webhook)
-result = syncer.sync(csv_path)
-print('Rows sent:', result)
\ No newline at end of file
+cfg = load_config()
+sheets_cfg = cfg.get('google_sheets', {}) or {}
+webhook = sheets_cfg.get('webhook_url')
+if not webhook:
+    raise SystemExit("Missing 'webhook_url' under google_sheets in config/settings.yaml")
+syncer = SheetSync(webhook, columnar=bool(sheets_cfg.get('columnar_payload', False)))
+result = syncer.sync(str(enriched_output_path(cfg)))
+print('Rows sent:', result)
@@ -12,11 +12,16 @@ Hunter.io-based email enrichment engine with:
 - Domain format validation (must have TLD like .com, .io)
 - Last name validation (must be 2+ characters)
 - Error handling and retry logic
+- Persistent lookup cache in data/.hunter_cache (cache_ttl_days, default 30)
+- One domain-search per company shared by several rows (domain_search)
+- Concurrent lookups (aiohttp, bounded by max_concurrency + requests_per_second)
 - Auto-creates CSV files if missing
 - CSV preservation (doesn't delete existing data)
 
 New Key Management Logic:
 - When a key hits rate limit (429), skip it for the next 10 email verifications
+- Per-key pacing from Retry-After / X-RateLimit-* headers, with exponential
+  backoff plus jitter on repeated 429s
 - If a key fails more than 3 times in the session, discard it permanently
 - Track consecutive failures across all keys
 - If all keys fail for 10 consecutive email searches, stop enrichment
@@ -29,27 +34,92 @@ Flow:
 4. Find emails for each profile (respecting monthly cap)
 5. Filter by confidence threshold (50%+)
 6. Export enriched profiles to data/enriched_with_emails.csv
+   (or .parquet with enrichment.output_format: parquet)
 """
 
+import asyncio
+import hashlib
+import heapq
+import json
+import random
+import re
+import sqlite3
 import time
+from collections import Counter
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
-
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import aiohttp
 import pandas as pd
 import requests
 import yaml
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .utils import write_csv
 
 # ============================================================================
 # Configuration Loading
 # ============================================================================
 
 
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml C parser
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+
+@lru_cache(maxsize=4)
+def _parse_yaml(path: Path, mtime_ns: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime) so edits are picked up"""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
 def load_config() -> Dict[str, Any]:
-    """Load settings.yaml configuration"""
+    """Load settings.yaml configuration (re-parsed only when it changes)"""
     config_path = Path(__file__).parent.parent / "config" / "settings.yaml"
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f) or {}
+    return _parse_yaml(config_path, config_path.stat().st_mtime_ns) or {}
+
+
+def _header_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After / X-RateLimit-Reset value into seconds from now."""
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    # Large values are absolute epoch timestamps rather than deltas
+    if seconds > 1_000_000_000:
+        seconds -= time.time()
+    return max(seconds, 0.0)
+
+
+# ============================================================================
+# Validation Patterns
+# ============================================================================
+
+# Compiled once at import; shared by HunterClient's per-row checks and the
+# vectorized pre-filter in run_enrichment (which passes .pattern to Arrow).
+
+# Non-empty first label, alphabetic TLD of 2+ chars (lowercased input)
+DOMAIN_RE = re.compile(r"^[^.].*\.[a-z]{2,}$")
+
+# At least two characters that are neither dots nor whitespace, i.e.
+# 2+ chars left once dots are removed and the name is stripped
+LAST_NAME_RE = re.compile(r"(?s)[^.\s].*[^.\s]")
 
 
 # ============================================================================
@@ -99,7 +169,9 @@ class HunterClient:
             api_keys: List of {key: str, credits: int, status: str}
             config: Full settings.yaml config dict
         """
-        self.api_keys = api_keys
+        # Own copies: credits are updated per response, and the caller's
+        # dicts may be the shared parsed config
+        self.api_keys = [dict(k) for k in api_keys]
         self.config = config
 
         enr_cfg = config.get("enrichment", {}) or {}
@@ -110,9 +182,55 @@ class HunterClient:
         self.blacklist_domains = set(enr_cfg.get("blacklist_domains", []))
         # Add disposable domains to blacklist
         self.blacklist_domains.update(self.DISPOSABLE_DOMAINS)
+        # Normalized suffixes: a domain is blacklisted when any of its
+        # label suffixes (a.b.c -> a.b.c, b.c, c) is in this set
+        self._blacklist_suffixes = frozenset(
+            bd.lower().lstrip(".") for bd in self.blacklist_domains
+        )
 
         self.request_timeout = enr_cfg.get("request_timeout", 30)
 
+        # Endpoint URLs are fixed per client; build them once, not per lookup
+        self._finder_url = f"{self.BASE_URL}/email-finder"
+        self._domain_search_url = f"{self.BASE_URL}/domain-search"
+
+        # Pooled keep-alive session for the blocking find_email path; urllib3
+        # retries transient 5xx with backoff. 429 is left to key rotation,
+        # since the next key is usually free while this one cools down.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=enr_cfg.get("backoff", 0.5),
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET"],
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Persistent lookup cache (survives reruns, saves credits)
+        cache_dir = Path(enr_cfg.get("cache_dir", "data/.hunter_cache"))
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # SQLite in WAL mode: one indexed row per lookup, committed as it
+        # lands, so an interrupted run keeps everything resolved so far
+        self.cache = sqlite3.connect(str(cache_dir / "lookups.db"))
+        self.cache.execute("PRAGMA journal_mode=WAL")
+        self.cache.execute("PRAGMA synchronous=NORMAL")
+        self.cache.execute(
+            "CREATE TABLE IF NOT EXISTS lookups ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+        self.cache_ttl_seconds = float(enr_cfg.get("cache_ttl_days", 30)) * 86400
+
+        # Domains shared by several rows are resolved with one domain-search
+        self.domain_search = bool(enr_cfg.get("domain_search", True))
+        self.domain_search_limit = int(enr_cfg.get("domain_search_limit", 100))
+
         # Per-session key tracking
         # key_failures[index]: number of failures for that key
         # key_cooldowns[index]: attempt counter when key becomes available again
@@ -120,6 +238,19 @@ class HunterClient:
         self.key_cooldowns: Dict[int, int] = {}
         self.global_attempt_counter: int = 0  # incremented per email search
 
+        # Max-heap (by credits) of (-credits, index) for active keys; updated
+        # on credit changes instead of re-sorting all keys per lookup
+        self._key_heap: List[Tuple[int, int]] = [
+            (-self._credits(i), i)
+            for i, k in enumerate(self.api_keys)
+            if k.get("status") == "active" and k.get("key")
+        ]
+        heapq.heapify(self._key_heap)
+        # key_next_allowed[index]: monotonic time the key may be used again
+        # (from X-RateLimit-* / Retry-After headers or 429 backoff)
+        self.key_next_allowed: Dict[int, float] = {}
+        self.key_rate_limits: Dict[int, int] = {}
+
         logger.info(
             f"[Hunter] Initialized with {len(api_keys)} keys, "
             f"confidence threshold: {self.email_confidence_threshold}%"
@@ -129,87 +260,139 @@ class HunterClient:
         """Validate last name for Hunter.io API."""
         if not last_name:
             return False
-        clean_name = last_name.replace(".", "").strip()
-        if len(clean_name) < 2:
-            logger.debug(f"[Hunter] Invalid last name (too short): '{last_name}'")
+        if not LAST_NAME_RE.search(last_name):
+            logger.debug("[Hunter] Invalid last name (too short): '{}'", last_name)
             return False
         return True
 
     def _validate_domain(self, domain: str) -> bool:
         """Validate domain format for Hunter.io API."""
-        if not domain:
-            return False
-
-        domain = domain.lower().strip()
-        if "." not in domain:
-            logger.debug(f"[Hunter] Invalid domain (no TLD): {domain}")
+        d = (domain or "").lower().strip()
+        if not DOMAIN_RE.fullmatch(d):
+            logger.debug("[Hunter] Invalid domain format: {}", domain)
             return False
-
-        parts = domain.split(".")
-        if len(parts) < 2:
-            return False
-
-        tld = parts[-1]
-        if len(tld) < 2 or not tld.isalpha():
-            logger.debug(f"[Hunter] Invalid TLD: {tld}")
-            return False
-
-        if not parts[0]:
-            return False
-
         return True
 
-    def _get_active_keys_sorted(self) -> List[Tuple[str, int, int]]:
+    def _credits(self, key_index: int) -> int:
+        """Remaining credits for a key as an int (0 if unknown)."""
+        try:
+            return int(self.api_keys[key_index].get("credits") or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def _set_credits(self, key_index: int, credits: Any) -> None:
+        """Update a key's credits and re-queue it at its new priority."""
+        old = self._credits(key_index)
+        self.api_keys[key_index]["credits"] = credits
+        new = self._credits(key_index)
+        if new != old:
+            # Old heap entry goes stale and is dropped lazily on pop
+            heapq.heappush(self._key_heap, (-new, key_index))
+
+    def _next_key(self, tried: set) -> Optional[Tuple[str, int, int]]:
         """
-        Return list of active keys sorted by remaining credits desc, then index.
-
-        Each item: (key_str, index, credits)
+        Pop the best usable key off the heap: most credits, then lowest index.
 
-        Filters out:
-        - Keys with status != "active"
-        - Keys currently in cooldown period
-        - Keys that exceeded failure threshold (>3 failures)
+        Returns (key_str, index, credits) or None. Skips keys in `tried` and
+        keys in cooldown (both stay queued); drops stale entries and keys
+        that exceeded the failure threshold (>3 failures) for the session.
         """
-        active_keys: List[Tuple[str, int, int]] = []
+        popped: List[Tuple[int, int]] = []
+        picked: Optional[Tuple[str, int, int]] = None
 
-        for i, k in enumerate(self.api_keys):
-            if k.get("status") != "active":
+        while self._key_heap:
+            entry = heapq.heappop(self._key_heap)
+            neg_credits, i = entry
+            if -neg_credits != self._credits(i):
                 continue
 
-            key_str = k.get("key")
-            if not key_str:
-                continue
-
-            # Check if key exceeded failure threshold
             failures = self.key_failures.get(i, 0)
             if failures > 3:
                 logger.debug(
-                    f"[Hunter] Key {i + 1} discarded for session "
-                    f"(failures: {failures})"
+                    "[Hunter] Key {} discarded for session (failures: {})",
+                    i + 1,
+                    failures,
                 )
                 continue
 
-            # Check if key is in cooldown
+            popped.append(entry)
+            if i in tried:
+                continue
+
             cooldown_until = self.key_cooldowns.get(i, 0)
             if self.global_attempt_counter < cooldown_until:
                 logger.debug(
-                    f"[Hunter] Key {i + 1} in cooldown until attempt "
-                    f"{cooldown_until}, current: {self.global_attempt_counter}"
+                    "[Hunter] Key {} in cooldown until attempt {}, current: {}",
+                    i + 1,
+                    cooldown_until,
+                    self.global_attempt_counter,
                 )
                 continue
 
-            credits = int(k.get("credits") or 0)
-            active_keys.append((key_str, i, credits))
+            picked = (self.api_keys[i]["key"], i, -neg_credits)
+            break
 
-        if not active_keys:
+        for entry in popped:
+            heapq.heappush(self._key_heap, entry)
+        return picked
+
+    def _iter_keys(self) -> Iterator[Tuple[str, int, int]]:
+        """
+        Yield usable keys best-first, each at most once per lookup.
+
+        The next key is chosen lazily, so a 429 or credit update on one key
+        is reflected before the following key is picked.
+        """
+        tried: set = set()
+        while True:
+            picked = self._next_key(tried)
+            if picked is None:
+                return
+            tried.add(picked[1])
+            yield picked
+
+    def _has_usable_key(self) -> bool:
+        """True if at least one key is active, not discarded, not cooling down."""
+        if self._next_key(set()) is None:
             logger.warning(
                 "[Hunter] No usable API keys (all in cooldown or discarded)"
             )
-            return []
+            return False
+        return True
+
+    def _apply_rate_headers(
+        self, key_index: int, status_code: int, headers: Any
+    ) -> None:
+        """
+        Schedule the key's next request from the response.
 
-        # Sort by credits (highest first), then by index (lowest first)
-        active_keys.sort(key=lambda x: (-x[2], x[1]))
-        return active_keys
+        429 -> Retry-After if sent, else min(60, 2^n) + jitter for the n-th
+        429 on this key. Otherwise, X-RateLimit-Remaining of 0 holds the key
+        until X-RateLimit-Reset.
+        """
+        now = time.monotonic()
+        if status_code == 429:
+            n = self.key_rate_limits.get(key_index, 0) + 1
+            self.key_rate_limits[key_index] = n
+            delay = _header_seconds(headers.get("Retry-After"))
+            if delay is None:
+                delay = min(60, 2 ** n) + random.random()
+            self.key_next_allowed[key_index] = now + delay
+            return
+
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining"))
+        except (TypeError, ValueError):
+            return  # header absent or not a count
+        if remaining < 1:
+            reset = _header_seconds(headers.get("X-RateLimit-Reset"))
+            if reset:
+                self.key_next_allowed[key_index] = now + reset
+
+    def _key_wait(self, key_index: int) -> float:
+        """Seconds to wait before this key may be used (capped at 60)."""
+        wait = self.key_next_allowed.get(key_index, 0) - time.monotonic()
+        return min(max(wait, 0.0), 60.0)
 
     def _record_failure(self, key_index: int, is_rate_limit: bool = False) -> None:
         """
@@ -242,15 +425,266 @@ class HunterClient:
                 f"Discarding for this session."
             )
 
+    def _is_blacklisted(self, domain: str) -> bool:
+        """Check the domain's label suffixes against the blacklist set."""
+        labels = domain.lower().split(".")
+        return any(
+            ".".join(labels[i:]) in self._blacklist_suffixes
+            for i in range(len(labels))
+        )
+
+    def _should_lookup(
+        self, first_name: str, last_name: str, domain: str, linkedin_url: str
+    ) -> bool:
+        """Run the pre-API checks for one lookup."""
+        if not domain and not linkedin_url:
+            logger.debug("[Hunter] No domain or linkedin_url provided")
+            return False
+
+        if domain and not self._validate_domain(domain):
+            logger.debug("[Hunter] Skipping invalid domain format: {}", domain)
+            return False
+
+        if not self._validate_last_name(last_name):
+            logger.debug("[Hunter] Skipping - invalid last name: '{}'", last_name)
+            return False
+
+        if domain and self._is_blacklisted(domain):
+            logger.debug("[Hunter] Skipping blacklisted domain: {}", domain)
+            return False
+
+        return True
+
+    def _build_params(
+        self,
+        first_name: str,
+        last_name: str,
+        domain: str,
+        linkedin_url: str,
+    ) -> Tuple[Dict[str, str], str]:
+        """Build email-finder query params (minus api_key). Returns (params, identifier)."""
+        params = {
+            "first_name": first_name,
+            "last_name": last_name,
+        }
+
+        # Use domain if available, otherwise use linkedin_handle
+        if domain:
+            params["domain"] = domain
+            return params, domain
+
+        # Extract just the handle from full URL
+        # e.g. "https://linkedin.com/in/ritesh-arora" -> "ritesh-arora"
+        handle = linkedin_url
+        if "/in/" in handle:
+            handle = handle.split("/in/")[-1].strip("/")
+        params["linkedin_handle"] = handle
+        return params, handle
+
+    def _handle_error_status(
+        self, status_code: int, text: str, key_index: int, identifier: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Handle a non-2xx email-finder response.
+
+        Returns {"found": False} when the answer is final for this person,
+        or None when the next key should be tried.
+        """
+        if status_code == 429:
+            # Rate limited: record failure and set cooldown
+            self._record_failure(key_index, is_rate_limit=True)
+            return None
+
+        if status_code == 400:
+            # 400 means bad params for this person, not a key issue
+            logger.debug("[Hunter] 400 for {}: {}", identifier, text[:200])
+            return {"found": False}
+
+        if status_code == 404:
+            # Profile not in Hunter's database
+            logger.debug("[Hunter] Profile not found for {}", identifier)
+            return {"found": False}
+
+        logger.warning(
+            f"[Hunter] API error {status_code} for {identifier}: {text[:200]}"
+        )
+        self._record_failure(key_index, is_rate_limit=False)
+        return None
+
+    def _parse_payload(
+        self, data: Dict[str, Any], key_index: int
+    ) -> Dict[str, Any]:
+        """Turn a successful email-finder payload into a result dict."""
+        d = data.get("data") or {}
+        if not d:
+            logger.debug("[Hunter] No email found in Hunter response")
+            return {"found": False}
+
+        email = d.get("email")
+        score = d.get("score", 0)
+
+        if not email:
+            logger.debug("[Hunter] No email in response data")
+            return {"found": False}
+
+        threshold = self.email_confidence_threshold
+        if score < threshold:
+            logger.debug(
+                "[Hunter] {} below threshold ({}% < {}%)", email, score, threshold
+            )
+            return {
+                "found": False,
+                "email": email,
+                "confidence": score,
+            }
+
+        logger.info(f"[Hunter] ✅ Found: {email} ({score}%)")
+
+        # Update key credits if Hunter reports it
+        remaining = d.get("emails_remaining")
+        if remaining is not None:
+            try:
+                remaining_int = int(remaining)
+            except (TypeError, ValueError):
+                remaining_int = remaining
+            self._set_credits(key_index, remaining_int)
+            logger.debug(
+                "[Hunter] Key {} remaining: {}", key_index + 1, remaining_int
+            )
+
+        return {
+            "email": email,
+            "confidence": score,
+            "found": True,
+        }
+
+    @staticmethod
+    def _cache_key(
+        first_name: str, last_name: str, domain: str, linkedin_url: str
+    ) -> str:
+        """sha1 of first|last|identifier (domain, else LinkedIn URL)."""
+        identifier = domain or linkedin_url
+        raw = f"{first_name.lower()}|{last_name.lower()}|{identifier.lower()}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return a cached, unexpired result or None."""
+        row = self.cache.execute(
+            "SELECT result, ts FROM lookups WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        result, ts = row
+        if time.time() - ts > self.cache_ttl_seconds:
+            return None
+        return json.loads(result)
+
+    def _cache_set(self, key: str, result: Any) -> Any:
+        """Store a definitive API answer (found or not found) and return it."""
+        with self.cache:
+            self.cache.execute(
+                "INSERT OR REPLACE INTO lookups (key, result, ts) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(result), time.time()),
+            )
+        return result
+
+    def _match_person(
+        self, people: List[Dict[str, Any]], first_name: str, last_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Match a name against domain-search people; None if absent."""
+        first, last = first_name.lower(), last_name.lower()
+        for person in people:
+            if (
+                person["first_name"].lower() != first
+                or person["last_name"].lower() != last
+            ):
+                continue
+
+            email, score = person["email"], person["confidence"]
+            if score < self.email_confidence_threshold:
+                return {"found": False, "email": email, "confidence": score}
+            logger.info(f"[Hunter] ✅ Found via domain search: {email} ({score}%)")
+            return {"email": email, "confidence": score, "found": True}
+        return None
+
+    def new_async_session(self, max_connections: int) -> aiohttp.ClientSession:
+        """
+        Keep-alive connection pool to api.hunter.io for one enrichment run.
+
+        aiohttp is HTTP/1.1, so each in-flight request holds a socket; the
+        pool is capped at max_connections and reuses DNS + TCP/TLS across
+        requests. The client timeout is set once here, not per request.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=max_connections,
+            limit_per_host=max_connections,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+        )
+
+    def close(self) -> None:
+        """Close the persistent cache and release pooled connections."""
+        self.cache.close()
+        self.session.close()
+
+    def _finish_attempt(
+        self,
+        key_index: int,
+        status: int,
+        headers: Any,
+        body: bytes,
+        parse: Callable[[Dict[str, Any], int], Any],
+        not_found: Any,
+        identifier: str,
+    ) -> Tuple[bool, Any]:
+        """
+        Turn one keyed response into (done, value), for both HTTP clients.
+
+        done is True with parse(payload, key_index) for a 2xx response, or
+        with not_found when Hunter's answer is final (400 / 404); False
+        means try the next key. A 2xx body that is not JSON raises.
+        """
+        self._apply_rate_headers(key_index, status, headers)
+        if status in (200, 201):
+            return True, parse(json.loads(body or b"null") or {}, key_index)
+        text = body.decode("utf-8", errors="replace")
+        if self._handle_error_status(status, text, key_index, identifier) is not None:
+            return True, not_found
+        return False, None
+
+    def _attempt_failed(self, key_index: int, error: Exception) -> None:
+        """Log a failed request (either HTTP client) and count it against the key."""
+        if isinstance(error, (asyncio.TimeoutError, requests.Timeout)):
+            logger.warning(
+                f"[Hunter] Request timeout for key {key_index + 1}, "
+                "trying next key"
+            )
+        elif isinstance(error, (aiohttp.ClientError, requests.RequestException)):
+            logger.warning(
+                f"[Hunter] Request failed for key {key_index + 1}: {error}"
+            )
+        else:
+            # e.g. a 200 whose body is not JSON
+            logger.error(f"[Hunter] Unexpected error: {error}")
+        self._record_failure(key_index, is_rate_limit=False)
+
     def find_email(
         self, first_name: str, last_name: str, domain: str,
         linkedin_url: str = ""
     ) -> Optional[Dict[str, Any]]:
         """
-        Find email for person using Hunter.io API.
+        Find email for person using Hunter.io API (blocking, one lookup).
 
         Hunter.io accepts domain, company, or linkedin_url as identifier.
         We pass linkedin_url when domain is not available (LinkedIn scraping).
+        Requests go through the client's pooled requests.Session, so
+        sequential calls reuse connections; batches go through
+        dispatch_lookups instead.
 
         Returns:
             {
@@ -260,179 +694,431 @@ class HunterClient:
             }
             or None / {"found": False} if not found/error
         """
-        # Increment global attempt counter per email verification request
         self.global_attempt_counter += 1
 
-        if not domain and not linkedin_url:
-            logger.debug("[Hunter] No domain or linkedin_url provided")
+        if not self._should_lookup(first_name, last_name, domain, linkedin_url):
             return None
 
-        if domain and not self._validate_domain(domain):
-            logger.debug(f"[Hunter] Skipping invalid domain format: {domain}")
-            return None
+        cache_key = self._cache_key(first_name, last_name, domain, linkedin_url)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("[Hunter] Cache hit: {} {}", first_name, last_name)
+            return cached
 
-        if not self._validate_last_name(last_name):
-            logger.debug(f"[Hunter] Skipping - invalid last name: '{last_name}'")
-            return None
-
-        if domain:
-            domain_lower = domain.lower()
-            if any(domain_lower.endswith(bd) for bd in self.blacklist_domains):
-                logger.debug(f"[Hunter] Skipping blacklisted domain: {domain}")
-                return None
-
-        active_keys = self._get_active_keys_sorted()
-        if not active_keys:
+        if not self._has_usable_key():
             logger.warning(
                 f"[Hunter] No available keys for {first_name} {last_name}"
             )
             return None
 
-        # Try each eligible key at most once for this person
-        for key_str, key_index, credits in active_keys:
-            params = {
-                "api_key": key_str,
-                "first_name": first_name,
-                "last_name": last_name,
-            }
-
-            # Use domain if available, otherwise use linkedin_handle
-            if domain:
-                params["domain"] = domain
-                identifier = domain
-            else:
-                # Extract just the handle from full URL
-                # e.g. "https://linkedin.com/in/ritesh-arora" -> "ritesh-arora"
-                handle = linkedin_url
-                if "/in/" in handle:
-                    handle = handle.split("/in/")[-1].strip("/")
-                params["linkedin_handle"] = handle
-                identifier = handle
-
+        params, identifier = self._build_params(
+            first_name, last_name, domain, linkedin_url
+        )
+        for key_str, key_index, credits in self._iter_keys():
             logger.info(
                 f"[Hunter] Searching: {first_name} {last_name} @ {identifier} "
                 f"(key {key_index + 1}, credits: {credits})"
             )
 
+            wait = self._key_wait(key_index)
+            if wait:
+                time.sleep(wait)
+
             try:
-                resp = requests.get(
-                    f"{self.BASE_URL}/email-finder",
-                    params=params,
+                resp = self.session.get(
+                    self._finder_url,
+                    params={**params, "api_key": key_str},
                     timeout=self.request_timeout,
                 )
-
-                if resp.status_code == 429:
-                    # Rate limited: record failure and set cooldown
-                    self._record_failure(key_index, is_rate_limit=True)
-                    # Try next key
-                    continue
-
-                if resp.status_code == 400:
-                    logger.debug(
-                        f"[Hunter] 400 for {identifier}: "
-                        f"{resp.text[:200]}"
-                    )
-                    # 400 means bad params for this person, not a key issue
-                    return {"found": False}
-
-                if resp.status_code not in (200, 201):
-                    if resp.status_code == 404:
-                        # Profile not in Hunter's database
-                        logger.debug(
-                            f"[Hunter] Profile not found for {identifier}"
-                        )
-                        return {"found": False}
-                    logger.warning(
-                        f"[Hunter] API error {resp.status_code} "
-                        f"for {identifier}: {resp.text[:200]}"
-                    )
-                    self._record_failure(key_index, is_rate_limit=False)
-                    continue
-
-                data = resp.json() or {}
-                if not data.get("data"):
-                    logger.debug("[Hunter] No email found in Hunter response")
-                    return {"found": False}
-
-                d = data["data"]
-                email = d.get("email")
-                score = d.get("score", 0)
-
-                if not email:
-                    logger.debug("[Hunter] No email in response data")
-                    return {"found": False}
-
-                if score < self.email_confidence_threshold:
-                    logger.debug(
-                        f"[Hunter] {email} below threshold "
-                        f"({score}% < {self.email_confidence_threshold}%)"
-                    )
-                    return {
-                        "found": False,
-                        "email": email,
-                        "confidence": score,
-                    }
-
-                logger.info(f"[Hunter] ✅ Found: {email} ({score}%)")
-
-                # Update key credits if Hunter reports it
-                remaining = d.get("emails_remaining")
-                if remaining is not None:
-                    try:
-                        remaining_int = int(remaining)
-                    except (TypeError, ValueError):
-                        remaining_int = remaining
-                    self.api_keys[key_index]["credits"] = remaining_int
-                    logger.debug(
-                        f"[Hunter] Key {key_index + 1} remaining: {remaining_int}"
-                    )
-
-                return {
-                    "email": email,
-                    "confidence": score,
-                    "found": True,
-                }
-
-            except requests.exceptions.Timeout:
-                logger.warning(
-                    f"[Hunter] Request timeout for key {key_index + 1}, "
-                    "trying next key"
+                done, result = self._finish_attempt(
+                    key_index,
+                    resp.status_code,
+                    resp.headers,
+                    resp.content,
+                    self._parse_payload,
+                    {"found": False},
+                    identifier,
                 )
-                self._record_failure(key_index, is_rate_limit=False)
+            except Exception as e:
+                self._attempt_failed(key_index, e)
                 continue
+            if done:
+                return self._cache_set(cache_key, result)
+
+        logger.error(
+            f"[Hunter] All active keys failed or rate-limited for "
+            f"{first_name} {last_name} @ {domain}"
+        )
+        return None
+
+    async def _get_with_keys(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Dict[str, Any],
+        parse: Callable[[Dict[str, Any], int], Any],
+        not_found: Any,
+        identifier: str,
+        describe: str,
+    ) -> Any:
+        """
+        GET url with each usable key in turn until one gives a final answer.
+
+        Returns parse(payload, key_index) for a 2xx response, not_found when
+        Hunter's answer is final for this identifier (400 / 404), or None
+        once every key has failed. 429s, other errors, timeouts and
+        unparseable bodies count against the key and move on to the next.
+        """
+        for key_str, key_index, credits in self._iter_keys():
+            logger.info(
+                f"[Hunter] {describe} (key {key_index + 1}, credits: {credits})"
+            )
+
+            wait = self._key_wait(key_index)
+            if wait:
+                await asyncio.sleep(wait)
 
-            except requests.exceptions.RequestException as e:
-                logger.warning(
-                    f"[Hunter] Request failed for key {key_index + 1}: {e}"
+            try:
+                async with session.get(
+                    url,
+                    params={**params, "api_key": key_str},
+                ) as resp:
+                    body = await resp.read()
+                done, value = self._finish_attempt(
+                    key_index, resp.status, resp.headers, body,
+                    parse, not_found, identifier,
                 )
-                self._record_failure(key_index, is_rate_limit=False)
+            except Exception as e:
+                self._attempt_failed(key_index, e)
                 continue
+            if done:
+                return value
+
+        return None
+
+    async def _find_email_async(
+        self,
+        session: aiohttp.ClientSession,
+        first_name: str,
+        last_name: str,
+        domain: str,
+        linkedin_url: str = "",
+        domain_people: Optional[
+            Callable[[], Awaitable[List[Dict[str, Any]]]]
+        ] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up one person's email (see find_email for the result shape).
+
+        The HTTP call goes through a shared aiohttp session so round-trips
+        overlap under dispatch_lookups. When domain_people (returns a
+        shared domain-search) is given, a name match there skips the
+        email-finder call.
+        """
+        self.global_attempt_counter += 1
+
+        if not self._should_lookup(first_name, last_name, domain, linkedin_url):
+            return None
+
+        cache_key = self._cache_key(first_name, last_name, domain, linkedin_url)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("[Hunter] Cache hit: {} {}", first_name, last_name)
+            return cached
 
+        if domain_people is not None:
+            try:
+                people = await domain_people()
             except Exception as e:
-                logger.error(f"[Hunter] Unexpected error: {e}")
-                self._record_failure(key_index, is_rate_limit=False)
-                continue
+                # A failed shared search just means no shortcut for this row
+                logger.warning(f"[Hunter] Domain search failed for {domain}: {e}")
+                people = []
+            match = self._match_person(people, first_name, last_name)
+            if match is not None:
+                return self._cache_set(cache_key, match)
+
+        if not self._has_usable_key():
+            logger.warning(
+                f"[Hunter] No available keys for {first_name} {last_name}"
+            )
+            return None
 
-        logger.error(
-            f"[Hunter] All active keys failed or rate-limited for "
-            f"{first_name} {last_name} @ {domain}"
+        params, identifier = self._build_params(
+            first_name, last_name, domain, linkedin_url
+        )
+        result = await self._get_with_keys(
+            session,
+            self._finder_url,
+            params,
+            self._parse_payload,
+            {"found": False},
+            identifier,
+            f"Searching: {first_name} {last_name} @ {identifier}",
         )
+        if result is None:
+            logger.error(
+                f"[Hunter] All active keys failed or rate-limited for "
+                f"{first_name} {last_name} @ {domain}"
+            )
+            return None
+        return self._cache_set(cache_key, result)
+
+    @staticmethod
+    def _parse_people(data: Dict[str, Any], key_index: int) -> List[Dict[str, Any]]:
+        """Domain-search payload -> [{first_name, last_name, email, confidence}]."""
+        emails = (data.get("data") or {}).get("emails") or []
+        return [
+            {
+                "first_name": e.get("first_name") or "",
+                "last_name": e.get("last_name") or "",
+                "email": e["value"],
+                "confidence": e.get("confidence") or 0,
+            }
+            for e in emails
+            if e.get("value")
+        ]
+
+    async def _domain_search_async(
+        self, session: aiohttp.ClientSession, domain: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch everyone Hunter.io knows at a domain in one request.
+
+        Returns a list of {first_name, last_name, email, confidence};
+        empty when the domain has no results or every key failed.
+        """
+        cache_key = hashlib.sha1(f"domain|{domain}".encode("utf-8")).hexdigest()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("[Hunter] Cache hit: domain search {}", domain)
+            return cached
+
+        people = await self._get_with_keys(
+            session,
+            self._domain_search_url,
+            {"domain": domain, "limit": self.domain_search_limit},
+            self._parse_people,
+            [],
+            domain,
+            f"Domain search: {domain}",
+        )
+        if people is None:
+            return []
+        return self._cache_set(cache_key, people)
+
+
+# ============================================================================
+# Async Dispatch (bounded concurrency + token bucket)
+# ============================================================================
+
+
+class AsyncRateLimiter:
+    """Token bucket: at most `rate` acquisitions per `period` seconds."""
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.rate = max(float(rate), 1.0)
+        self.period = period
+        self._tokens = self.rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate,
+                    self._tokens + (now - self._updated) * self.rate / self.period,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep(
+                    (1 - self._tokens) * self.period / self.rate
+                )
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
         return None
 
 
+async def dispatch_lookups(
+    client: HunterClient,
+    pending: List[Tuple[Any, str, str, str, str]],
+    budget: int,
+    max_concurrency: int = 16,
+    requests_per_second: float = 10,
+) -> Dict[Any, Optional[Dict[str, Any]]]:
+    """
+    Run Hunter.io lookups concurrently.
+
+    Args:
+        client: Initialized HunterClient
+        pending: List of (idx, first_name, last_name, domain, linkedin_url)
+        budget: Max number of new emails to find (monthly cap headroom)
+        max_concurrency: Max in-flight requests
+        requests_per_second: Token-bucket rate across all keys
+
+    Rows are dispatched in waves no larger than the remaining budget, so the
+    cap is never overshot. Dispatch stops once all keys have been unusable
+    for 10 consecutive searches. Domains shared by 2+ rows get a single
+    domain-search that all of those rows match against before falling
+    back to email-finder.
+
+    Returns:
+        {idx: find_email result}
+    """
+    results: Dict[Any, Optional[Dict[str, Any]]] = {}
+    sem = asyncio.Semaphore(max_concurrency)
+    limiter = AsyncRateLimiter(requests_per_second)
+    consecutive_failures = 0
+
+    shared_domains: set = set()
+    if client.domain_search:
+        domain_counts = Counter(row[3].lower() for row in pending if row[3])
+        shared_domains = {d for d, n in domain_counts.items() if n > 1}
+    domain_searches: Dict[str, asyncio.Task] = {}
+
+    def search_domain(domain: str) -> asyncio.Task:
+        if domain not in domain_searches:
+            domain_searches[domain] = asyncio.ensure_future(
+                client._domain_search_async(session, domain)
+            )
+        return domain_searches[domain]
+
+    async def bounded(idx, first_name, last_name, domain, linkedin_url):
+        nonlocal consecutive_failures
+        async with sem:
+            if consecutive_failures >= 10:
+                return idx, None
+            async with limiter:
+                result = await client._find_email_async(
+                    session,
+                    first_name,
+                    last_name,
+                    domain,
+                    linkedin_url,
+                    domain_people=(
+                        partial(search_domain, domain.lower())
+                        if domain.lower() in shared_domains
+                        else None
+                    ),
+                )
+
+        if result and result.get("found"):
+            consecutive_failures = 0
+        elif not client._has_usable_key():
+            consecutive_failures += 1
+            logger.warning(
+                f"  ⚠️ [{idx + 1}] No available keys. "
+                f"Consecutive failures: {consecutive_failures}/10"
+            )
+        else:
+            consecutive_failures = 0  # Reset if keys are available
+        return idx, result
+
+    async with client.new_async_session(max_concurrency) as session:
+        queue = list(pending)
+        found = 0
+        while queue and found < budget and consecutive_failures < 10:
+            wave_size = budget - found
+            wave, queue = queue[:wave_size], queue[wave_size:]
+            wave_results = await asyncio.gather(
+                *(bounded(*row) for row in wave)
+            )
+            for idx, result in wave_results:
+                results[idx] = result
+                if result and result.get("found"):
+                    found += 1
+
+    if consecutive_failures >= 10:
+        logger.error(
+            "❌ All keys exhausted or rate-limited for 10 consecutive "
+            "email searches. Stopping enrichment."
+        )
+        logger.info("   Moving to sheet sync and next procedures...")
+
+    return results
+
+
 # ============================================================================
 # Main Enrichment Engine
 # ============================================================================
 
+# Explicit dtypes for the columns enrichment touches (Arrow-backed string,
+# so .str ops run as Arrow compute kernels, and nullable Int16 for the
+# 0-100 score); other scraper text columns are read as Arrow strings and
+# passed through untouched.
+PROFILE_DTYPES = {
+    "first_name": "string[pyarrow]",
+    "last_name": "string[pyarrow]",
+    "domain": "string[pyarrow]",
+    "linkedin_url": "string[pyarrow]",
+    "email": "string[pyarrow]",
+    "confidence": "Int16",
+}
+
+
+def enriched_output_path(config: Dict[str, Any]) -> Path:
+    """
+    Where Stage 4 writes enriched profiles.
+
+    enrichment.output_csv sets the path; enrichment.output_format: parquet
+    swaps the suffix to .parquet (columnar, zstd-compressed).
+    """
+    enr_cfg = config.get("enrichment", {}) or {}
+    path = Path(enr_cfg.get("output_csv", "data/enriched_with_emails.csv"))
+    if enr_cfg.get("output_format", "csv") == "parquet":
+        return path.with_suffix(".parquet")
+    return path
 
-def run_enrichment() -> pd.DataFrame:
+
+def _read_profiles(path: Path) -> pd.DataFrame:
+    """
+    Read scraped profiles with Arrow's multithreaded CSV reader.
+
+    Falls back to pandas' C parser (same dtypes) when Arrow rejects the
+    file, e.g. rows whose quoting it cannot tokenize.
+    """
+    try:
+        df = pd.read_csv(
+            path, engine="pyarrow", dtype=PROFILE_DTYPES, on_bad_lines="skip"
+        )
+    except ValueError as e:  # pyarrow.ArrowInvalid is a ValueError
+        logger.warning(f"⚠️ Arrow CSV reader failed ({e}); using C parser")
+        df = pd.read_csv(path, dtype=PROFILE_DTYPES, on_bad_lines="skip")
+
+    # Passthrough text columns (title, company, ...) become Arrow strings
+    # too, instead of one Python str object per cell. A column with no
+    # values at all is parsed as float64, so all-NA counts as text.
+    text_cols = [
+        col
+        for col in df.columns
+        if col not in PROFILE_DTYPES
+        and (
+            not pd.api.types.is_numeric_dtype(df[col])
+            or df[col].isna().all()
+        )
+    ]
+    return df.astype(dict.fromkeys(text_cols, "string[pyarrow]"))
+
+
+def run_enrichment(config: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
     Main enrichment pipeline.
 
+    Args:
+        config: Parsed settings.yaml (loaded here when not passed in)
+
     Returns:
         DataFrame with enriched profiles (only rows with emails)
     """
-    config = load_config()
+    if config is None:
+        config = load_config()
 
     logger.info("=" * 80)
     logger.info("📧 OUTREACH ENGINE - ENRICHMENT MODULE")
@@ -455,7 +1141,7 @@ def run_enrichment() -> pd.DataFrame:
         return pd.DataFrame()
 
     try:
-        df = pd.read_csv(input_csv)
+        df = _read_profiles(input_path)
         logger.info(f"✅ Loaded {len(df)} profiles from {input_csv}")
     except Exception as e:
         logger.error(f"❌ Failed to load CSV: {e}")
@@ -465,6 +1151,10 @@ def run_enrichment() -> pd.DataFrame:
         logger.error("❌ Scraped CSV is empty (scraper found no profiles)")
         return df
 
+    # Blank / whitespace emails become NA so "has email" is just notna()
+    if "email" in df.columns:
+        df["email"] = df["email"].str.strip().replace("", pd.NA)
+
     logger.info(f"   Columns: {', '.join(df.columns)}")
     logger.info("")
 
@@ -506,108 +1196,154 @@ def run_enrichment() -> pd.DataFrame:
     logger.info("")
 
     if "email" not in df.columns:
-        df["email"] = ""
+        df["email"] = pd.Series(
+            pd.NA, index=df.index, dtype=PROFILE_DTYPES["email"]
+        )
     if "confidence" not in df.columns:
-        df["confidence"] = 0
-
-    enriched_count = 0
-    skipped_count = 0
-    invalid_domain_count = 0
-    invalid_name_count = 0
-    consecutive_failures = 0  # Track consecutive failures across all keys
-
-    for idx, row in df.iterrows():
-        # Already has email
-        existing_email = str(row.get("email", "")).strip()
-        if existing_email:
-            logger.debug(f"  [{idx + 1}] Already has email: {existing_email}")
-            enriched_count += 1
-            continue
-
-        # Check email cap
-        if enriched_count >= email_cap:
-            logger.info(
-                f"✅ Reached email cap ({email_cap}). Stopping enrichment."
-            )
-            break
+        df["confidence"] = pd.Series(
+            0, index=df.index, dtype=PROFILE_DTYPES["confidence"]
+        )
 
-        # Check if all keys are exhausted for 10 consecutive attempts
-        if consecutive_failures >= 10:
-            logger.error(
-                "❌ All keys exhausted or rate-limited for 10 consecutive "
-                "email searches. Stopping enrichment."
-            )
-            logger.info(
-                "   Moving to sheet sync and next procedures..."
-            )
-            break
+    max_concurrency = int(enr_cfg.get("max_concurrency", 16))
+    requests_per_second = float(enr_cfg.get("requests_per_second", 10))
+    logger.info(
+        f"Concurrency: {max_concurrency} in flight, "
+        f"{requests_per_second:g} req/s"
+    )
+    logger.info("")
 
-        first_name = str(row.get("first_name", "")).strip()
-        last_name = str(row.get("last_name", "")).strip()
-        domain = str(row.get("domain", "")).strip()
-        linkedin_url = str(row.get("linkedin_url", "")).strip()
+    # Rows that already have an email count toward the cap and are never
+    # looked at again; everything below works on the remaining rows only.
+    has_email = df["email"].notna()
+    existing_count = int(has_email.sum())
+    budget = max(0, email_cap - existing_count)
+    df_todo = df.loc[~has_email] if budget else df.iloc[0:0]
+
+    # Validate the remaining rows up front with vectorized string ops; only
+    # rows that pass all checks are dispatched to Hunter.io.
+    cols = {}
+    for col in ("first_name", "last_name", "domain", "linkedin_url"):
+        series = (
+            df_todo[col]
+            if col in df_todo.columns
+            else pd.Series("", index=df_todo.index, dtype="string[pyarrow]")
+        )
+        cols[col] = series.fillna("").str.strip()
+
+    dom = cols["domain"].str.lower()
+    has_name = cols["first_name"].ne("") & cols["last_name"].ne("")
+    has_target = dom.ne("") | cols["linkedin_url"].ne("")
+    valid_domain = dom.eq("") | dom.str.contains(DOMAIN_RE.pattern, regex=True)
+    valid_last = cols["last_name"].str.contains(LAST_NAME_RE.pattern, regex=True)
+    # Prefix a dot so "x.gmail.com" matches "gmail.com" but "notgmail.com"
+    # does not (same label-suffix rule as HunterClient._is_blacklisted)
+    blacklisted = dom.ne("") & ("." + dom).str.endswith(
+        tuple("." + bd for bd in client._blacklist_suffixes)
+    )
 
-        if not first_name or not last_name:
-            logger.debug(
-                f"  [{idx + 1}] Skipping - missing name "
-                f"(name: {first_name} {last_name})"
-            )
-            skipped_count += 1
-            continue
+    candidates = has_name & has_target
+    eligible = candidates & valid_domain & valid_last & ~blacklisted
 
-        if not domain and not linkedin_url:
-            logger.debug(f"  [{idx + 1}] Skipping - no domain or linkedin_url")
-            skipped_count += 1
-            continue
+    skipped_count = int(
+        (~candidates).sum()
+        + (candidates & valid_domain & valid_last & blacklisted).sum()
+    )
+    invalid_domain_count = int((candidates & ~valid_domain).sum())
+    invalid_name_count = int((candidates & valid_domain & ~valid_last).sum())
+    logger.debug(
+        f"  Pre-filter: {existing_count} already have email, "
+        f"{skipped_count} missing name/target or blacklisted, "
+        f"{invalid_domain_count} invalid domains, "
+        f"{invalid_name_count} invalid last names"
+    )
 
-        if domain and not client._validate_domain(domain):
-            logger.debug(
-                f"  [{idx + 1}] Skipping - invalid domain format: {domain}"
-            )
-            invalid_domain_count += 1
-            continue
+    # Use linkedin_url for Hunter.io lookup (domain is typically empty from scraper)
+    work = pd.DataFrame(
+        {
+            "first_name": cols["first_name"],
+            "last_name": cols["last_name"],
+            "domain": cols["domain"],
+            "linkedin_url": cols["linkedin_url"],
+        }
+    )[eligible]
+
+    # Coalesce duplicate people (same name at the same domain / LinkedIn
+    # profile) into one lookup; the answer is fanned back out to every row.
+    identifier = work["domain"].where(work["domain"].ne(""), work["linkedin_url"])
+    lookup_key = (
+        work["first_name"].str.lower()
+        + "|"
+        + work["last_name"].str.lower()
+        + "|"
+        + identifier.str.lower()
+    )
+    unique_work = work[~lookup_key.duplicated()]
+    if len(unique_work) < len(work):
+        logger.info(
+            f"Coalesced {len(work) - len(unique_work)} duplicate profiles "
+            f"into {len(unique_work)} lookups"
+        )
 
-        if not client._validate_last_name(last_name):
-            logger.debug(
-                f"  [{idx + 1}] Skipping - invalid last name: '{last_name}'"
+    # An interrupted run resumes through the lookup cache: every resolved
+    # lookup is committed there as it lands, and cached hits count toward
+    # the budget without spending credits.
+    pending: List[Tuple[Any, str, str, str, str]] = list(
+        unique_work.itertuples(index=True, name=None)
+    )
+
+    try:
+        results = asyncio.run(
+            dispatch_lookups(
+                client,
+                pending,
+                budget,
+                max_concurrency,
+                requests_per_second,
             )
-            invalid_name_count += 1
-            continue
+        )
+    finally:
+        client.close()
 
-        # Use linkedin_url for Hunter.io lookup (domain is typically empty from scraper)
-        result = client.find_email(first_name, last_name, domain, linkedin_url)
+    # Row index -> index of the row whose lookup answers it
+    lookup_idx = lookup_key.map(
+        pd.Series(unique_work.index, index=lookup_key[unique_work.index])
+    )
 
-        if result and result.get("found"):
-            email = result["email"]
-            confidence = result["confidence"]
-            df.at[idx, "email"] = email
-            df.at[idx, "confidence"] = confidence
-            enriched_count += 1
-            consecutive_failures = 0  # Reset consecutive failure counter
-            logger.info(
-                f"  ✅ [{idx + 1}] {first_name} {last_name} → "
-                f"{email} ({confidence}%)"
-            )
-        else:
-            # Check if it's because no keys are available (all exhausted)
-            active_keys = client._get_active_keys_sorted()
-            if not active_keys:
-                consecutive_failures += 1
-                logger.warning(
-                    f"  ⚠️ [{idx + 1}] No available keys. "
-                    f"Consecutive failures: {consecutive_failures}/10"
+    # Per-lookup answers fanned out to every row in one map per column
+    found = {i: r for i, r in results.items() if r and r.get("found")}
+    row_email = lookup_idx.map(
+        pd.Series({i: r["email"] for i, r in found.items()}, dtype=object)
+    ).astype(PROFILE_DTYPES["email"])
+    row_conf = lookup_idx.map(
+        pd.Series({i: r["confidence"] for i, r in found.items()}, dtype=object)
+    ).astype(PROFILE_DTYPES["confidence"])
+    is_found = row_email.notna()
+
+    enriched_count = existing_count + int(is_found.sum())
+    skipped_count += int((lookup_idx.isin(list(results)) & ~is_found).sum())
+
+    if is_found.any():
+        hits = work[is_found]
+        logger.info(
+            "Enriched rows:\n"
+            + "\n".join(
+                f"  ✅ [{idx + 1}] {first} {last} → {email} ({conf}%)"
+                for idx, first, last, email, conf in zip(
+                    hits.index,
+                    hits["first_name"],
+                    hits["last_name"],
+                    row_email[is_found],
+                    row_conf[is_found],
                 )
-            else:
-                consecutive_failures = 0  # Reset if keys are available
-
-            logger.debug(
-                f"  ❌ [{idx + 1}] {first_name} {last_name} "
-                f"- No email found"
             )
-            skipped_count += 1
+        )
+
+        # Single bulk write-back instead of per-row df.at assignments
+        df.loc[hits.index, "email"] = row_email[is_found]
+        df.loc[hits.index, "confidence"] = row_conf[is_found]
 
-        # Rate limiting courtesy delay
-        time.sleep(0.5)
+    if enriched_count >= email_cap:
+        logger.info(f"✅ Reached email cap ({email_cap}). Stopping enrichment.")
 
     logger.info("")
     logger.info(
@@ -623,19 +1359,18 @@ def run_enrichment() -> pd.DataFrame:
     logger.info("💾 STAGE 4: EXPORT ENRICHED PROFILES")
     logger.info("-" * 80)
 
-    df_with_emails = df[
-        df["email"].notna() & (df["email"].astype(str).str.strip() != "")
-    ].copy()
-
-    output_csv = Path(
-        enr_cfg.get("output_csv", "data/enriched_with_emails.csv")
-    )
+    # Boolean-indexed result is only written and returned, never mutated
+    df_with_emails = df[df["email"].notna()]
 
-    output_csv.parent.mkdir(parents=True, exist_ok=True)
-    df_with_emails.to_csv(output_csv, index=False)
+    output_path = enriched_output_path(config)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if output_path.suffix == ".parquet":
+        df_with_emails.to_parquet(output_path, compression="zstd", index=False)
+    else:
+        write_csv(df_with_emails, output_path)
 
     logger.info(
-        f"✅ Exported {len(df_with_emails)} enriched profiles to {output_csv}"
+        f"✅ Exported {len(df_with_emails)} enriched profiles to {output_path}"
     )
 
     if len(df_with_emails) == 0:
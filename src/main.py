@@ -12,15 +12,14 @@ Run with: python -m src.main
 """
 
 import sys
-from pathlib import Path
 
-import yaml
 from loguru import logger
 
 # Import modules
 from .scraper import run_scraper
-from .enrichment import run_enrichment
+from .enrichment import enriched_output_path, load_config, run_enrichment
 from .sheet_sync import SheetSync
+from .utils import setup_file_logging
 
 
 # ============================================================================
@@ -42,6 +41,7 @@ def setup_logging(config: dict) -> None:
         ),
         level=log_level,
     )
+    setup_file_logging(log_level)
 
 
 # ============================================================================
@@ -54,10 +54,8 @@ def run_full_pipeline() -> bool:
     Execute complete outreach engine pipeline:
     Scraping → Enrichment → Sheets Sync
     """
-    # Load config
-    config_path = Path(__file__).parent.parent / "config" / "settings.yaml"
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f) or {}
+    # Load config once; the same dict is passed to every stage
+    config = load_config()
 
     # Setup logging
     setup_logging(config)
@@ -81,7 +79,7 @@ def run_full_pipeline() -> bool:
     logger.info("-" * 80)
 
     try:
-        df_scraped = run_scraper()
+        df_scraped = run_scraper(config)
 
         if df_scraped.empty:
             logger.error("❌ Scraping failed. Aborting pipeline.")
@@ -103,7 +101,7 @@ def run_full_pipeline() -> bool:
     logger.info("-" * 80)
 
     try:
-        df_enriched = run_enrichment()
+        df_enriched = run_enrichment(config)
 
         if df_enriched.empty:
             logger.error("❌ Enrichment returned no profiles")
@@ -127,16 +125,20 @@ def run_full_pipeline() -> bool:
     logger.info("-" * 80)
 
     # Get sheet sync config from settings
-    webhook_url = config.get("google_sheets", {}).get("webhook_url")
+    sheets_cfg = config.get("google_sheets", {})
+    webhook_url = sheets_cfg.get("webhook_url")
 
     if not webhook_url:
         logger.error("❌ Missing 'webhook_url' in config/settings.yaml")
         return False
 
     try:
-        # Initialize and run sheet sync (reads data/enriched_with_emails.csv)
-        sheet_sync = SheetSync(webhook_url=webhook_url)
-        rows_sent = sheet_sync.sync()
+        # Initialize and run sheet sync (reads the enrichment output file)
+        sheet_sync = SheetSync(
+            webhook_url=webhook_url,
+            columnar=bool(sheets_cfg.get("columnar_payload", False)),
+        )
+        rows_sent = sheet_sync.sync(str(enriched_output_path(config)))
 
         if rows_sent == 0:
             logger.warning("⚠️ Sheet sync completed but no rows were sent")
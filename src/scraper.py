@@ -11,6 +11,7 @@ Enterprise-grade LinkedIn scraper with:
 """
 
 import asyncio
+import itertools
 import aiohttp
 import pandas as pd
 import yaml
@@ -22,28 +23,62 @@ from urllib.parse import urlparse
 import re
 import requests
 import math
+from functools import lru_cache
+
+from .utils import write_csv
+
+try:
+    from orjson import loads as json_loads  # SIMD JSON decoder
+except ImportError:  # pragma: no cover - orjson not installed
+    from json import loads as json_loads
+
+try:
+    from uvloop import EventLoopPolicy as ScrapeLoopPolicy  # libuv event loop
+except ImportError:  # pragma: no cover - uvloop not installed (e.g. Windows)
+    ScrapeLoopPolicy = None
 
 # ============================================================================
 # Configuration Loading
 # ============================================================================
 
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml C parser
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+@lru_cache(maxsize=8)
+def _parse_yaml(path: Path, mtime_ns: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime) so edits are picked up"""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+def _load_yaml(path: Path) -> Any:
+    return _parse_yaml(path, path.stat().st_mtime_ns)
+
 def load_config():
     """Load settings.yaml configuration"""
     config_path = Path(__file__).parent.parent / "config" / "settings.yaml"
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml(config_path) or {}
 
 def load_queries():
     """Load queries.yaml"""
     queries_path = Path(__file__).parent.parent / "config" / "queries.yaml"
-    with open(queries_path, "r") as f:
-        data = yaml.safe_load(f) or {}
+    data = _load_yaml(queries_path) or {}
     return data.get("queries", [])
 
 # ============================================================================
 # Name & Domain Extraction (IMPROVED)
 # ============================================================================
 
+# Role/company parsing patterns, compiled once instead of on every title
+ROLE_COMPANY_AT_RE = re.compile(r"\s+at\s+", re.IGNORECASE)
+FIELD_CUT_RE = re.compile(r'[,|·(]')
+TRAILING_JUNK_RE = re.compile(r'[.\s🚀👋🏽…]+$')
+# Profile handle: everything after linkedin.com/in/ up to the next / or ?
+LINKEDIN_RE = re.compile(r"linkedin\.com/in/([^/?]*)")
+# Name part of a title: everything before the first "|" or " - "
+NAME_RE = re.compile(r"[^|]*?(?= - |\||$)")
+
 def extract_name_from_title(title: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Extract first and last name from LinkedIn profile title.
@@ -52,11 +87,8 @@ def extract_name_from_title(title: str) -> Tuple[Optional[str], Optional[str]]:
     if not title:
         return None, None
     
-    # Remove job titles and company info
-    title_clean = title.split("|")[0].split(" - ")[0].strip()
-    
-    # Split on whitespace
-    parts = title_clean.split()
+    # Remove job titles and company info, then split on whitespace
+    parts = NAME_RE.match(title).group(0).split()
     
     if len(parts) >= 2:
         return parts[0], " ".join(parts[1:])
@@ -65,6 +97,24 @@ def extract_name_from_title(title: str) -> Tuple[Optional[str], Optional[str]]:
     
     return None, None
 
+def extract_names_from_titles(titles: pd.Series) -> pd.DataFrame:
+    """
+    Vectorized extract_name_from_title over a column of titles.
+    Returns a DataFrame with first_name / last_name (None when missing).
+    """
+    cleaned = titles.fillna("").str.extract(f"({NAME_RE.pattern})", expand=False)
+    # Default split is Unicode whitespace (NBSP included), as in str.split();
+    # a regex \s on Arrow strings is RE2's ASCII-only class
+    parts = cleaned.str.split()
+    names = pd.DataFrame(
+        {
+            "first_name": parts.str[0],
+            "last_name": parts.str[1:].str.join(" "),
+        },
+        index=titles.index,
+    ).astype(object)
+    return names.where(names.notna() & names.ne(""), None)
+
 def extract_role_and_company(title: str) -> Tuple[str, str]:
     """
     Extract job role and company from LinkedIn profile title.
@@ -89,7 +139,7 @@ def extract_role_and_company(title: str) -> Tuple[str, str]:
 
     # Try to split role and company by "at" or "@"
     if " at " in rest.lower():
-        split = re.split(r"\s+at\s+", rest, maxsplit=1, flags=re.IGNORECASE)
+        split = ROLE_COMPANY_AT_RE.split(rest, maxsplit=1)
         role = split[0].strip()
         company = split[1].strip() if len(split) > 1 else ""
     elif " @ " in rest:
@@ -101,40 +151,27 @@ def extract_role_and_company(title: str) -> Tuple[str, str]:
         role = rest
 
     # Clean up: truncate at commas, pipes, or parentheses
-    for field_val, setter in [(role, 'role'), (company, 'company')]:
-        cleaned = re.split(r'[,|·(]', field_val)[0].strip()
-        # Remove trailing dots/spaces/emojis
-        cleaned = re.sub(r'[.\s🚀👋🏽…]+$', '', cleaned).strip()
-        if setter == 'role':
-            role = cleaned
-        else:
-            company = cleaned
+    return _clean_title_field(role), _clean_title_field(company)
 
-    return role, company
+def _clean_title_field(value: str) -> str:
+    """Truncate at commas/pipes/parentheses and drop trailing dots/emojis."""
+    cleaned = FIELD_CUT_RE.split(value, maxsplit=1)[0].strip()
+    return TRAILING_JUNK_RE.sub('', cleaned).strip()
 
 def extract_domain_from_link(link: str) -> Optional[str]:
     """
     Extract domain from LinkedIn profile link.
     Improved to handle various LinkedIn URL formats.
     """
-    if not link or "linkedin.com/in/" not in link:
+    m = LINKEDIN_RE.search(link) if link else None
+    if not m:
         return None
     
-    try:
-        # Extract everything after /in/
-        parts = link.split("/in/")
-        if len(parts) < 2:
-            return None
-        
-        username = parts[1].split("/")[0].split("?")[0].strip()
-        
-        if username and len(username) > 2:
-            return f"linkedin.com/in/{username}"
-        
-        return None
-    except Exception as e:
-        logger.debug(f"Domain extraction failed for {link}: {e}")
-        return None
+    username = m.group(1).strip()
+    if len(username) > 2:
+        return f"linkedin.com/in/{username}"
+    
+    return None
 
 # ============================================================================
 # Proxy Management
@@ -145,16 +182,14 @@ class ProxyRotator:
     
     def __init__(self, proxies: List[str]):
         self.proxies = proxies
-        self.current_index = 0
+        # C-level round robin; next() is a single call with no index math
+        self._cycle = itertools.cycle(proxies) if proxies else None
+        # Same proxy strings repeat forever, so build each dict once
+        self._dicts = {p: {"http": p, "https": p} for p in proxies}
     
     def get_proxy(self) -> Optional[str]:
         """Get next proxy in rotation"""
-        if not self.proxies:
-            return None
-        
-        proxy = self.proxies[self.current_index]
-        self.current_index = (self.current_index + 1) % len(self.proxies)
-        return proxy
+        return next(self._cycle) if self._cycle else None
     
     def get_proxy_dict(self) -> Optional[Dict[str, str]]:
         """Get proxy as aiohttp-compatible dict"""
@@ -162,29 +197,135 @@ class ProxyRotator:
         if not proxy:
             return None
         
-        return {"http": proxy, "https": proxy}
+        return self._dicts[proxy]
+
+# ============================================================================
+# Rate Limiting
+# ============================================================================
+
+class LeakyBucket:
+    """Shared request schedule: at most one acquisition every `interval` s"""
+    
+    def __init__(self, interval: float):
+        self.interval = max(float(interval), 0.0)
+        self._next_slot = 0.0
+        self.throttled = 0  # consecutive 429s from the host
+    
+    async def acquire(self) -> None:
+        """Reserve the next free slot and sleep until it arrives"""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        # Reserved before awaiting, so concurrent callers queue up in order
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def backoff(self, retry_after: Optional[str] = None) -> float:
+        """
+        Push every caller's next slot back after a 429.
+        Uses Retry-After (seconds) when sent, else 1, 2, 4... capped at 60s.
+        """
+        try:
+            delay = max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            delay = float(min(60, 2 ** self.throttled))
+        self.throttled += 1
+        now = asyncio.get_running_loop().time()
+        self._next_slot = max(self._next_slot, now + delay)
+        return delay
+    
+    def recover(self) -> None:
+        """Reset the backoff after a successful response"""
+        self.throttled = 0
 
 # ============================================================================
 # Async Scraping Functions
 # ============================================================================
 
+# Columns of the per-profile tuples built in scrape_query (names are
+# derived from titles afterwards, in one vectorized pass)
+PROFILE_COLUMNS = ["linkedin_url", "title", "job_title", "company", "source_query"]
+
+MAX_RATE_LIMIT_RETRIES = 5
+
+async def fetch_page(
+    session: aiohttp.ClientSession,
+    params: Dict[str, Any],
+    limiter: "LeakyBucket",
+    proxy_rotator: ProxyRotator,
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch one SerpAPI page, retrying the same page on 429.
+    Returns None if the host is still rate limiting after the retries.
+    """
+    for _ in range(MAX_RATE_LIMIT_RETRIES + 1):
+        # Wait for this page's slot in the shared request schedule
+        await limiter.acquire()
+        
+        # Get proxy
+        proxy_dict = proxy_rotator.get_proxy_dict()
+        
+        async with session.get(
+            "https://serpapi.com/search",
+            params=params,
+            proxy=proxy_dict.get("http") if proxy_dict else None,
+        ) as resp:
+            
+            if resp.status == 429:  # Rate limited
+                wait = limiter.backoff(resp.headers.get("Retry-After"))
+                logger.warning(f"[SerpAPI] Rate limited. Retrying in {wait:.0f}s...")
+                continue
+            
+            resp.raise_for_status()
+            limiter.recover()
+            return await resp.json(loads=json_loads, content_type=None)
+    
+    logger.warning(f"[SerpAPI] Still rate limited after {MAX_RATE_LIMIT_RETRIES} retries")
+    return None
+
+class ScrapeBudget:
+    """
+    Profiles still wanted across all queries, plus the profile URLs
+    (linkedin.com/in/..., no scheme) already kept.
+    Shared by follow-up queries on one event loop, so no lock is needed.
+    """
+    
+    def __init__(self, remaining: int, seen: set):
+        self.remaining = remaining
+        self.seen = seen
+    
+    def take(self, url: str) -> bool:
+        """Claim one slot for a URL not seen yet in this run"""
+        if self.remaining <= 0 or url in self.seen:
+            return False
+        self.seen.add(url)
+        self.remaining -= 1
+        return True
+
 async def scrape_query(
     session: aiohttp.ClientSession,
     query: str,
     api_key: str,
     results_limit: int,  # NEW: limit per query
-    delay: float,
+    limiter: "LeakyBucket",
     proxy_rotator: ProxyRotator,
-    config: Dict[str, Any]
-) -> List[Dict[str, Any]]:
+    config: Dict[str, Any],
+    start_page: int = 0,
+    max_pages: Optional[int] = None,
+    budget: Optional[ScrapeBudget] = None,
+) -> List[Tuple[str, ...]]:
     """
     Scrape single query with async requests and proxy rotation.
-    Limited to results_limit profiles per query.
+    Limited to results_limit profiles per query (and, for follow-up
+    rounds, to what the shared budget still allows).
+    Returns one tuple per profile, in PROFILE_COLUMNS order.
     """
     profiles = []
     pages_needed = math.ceil(results_limit / 10)  # 10 results per page
+    if max_pages is not None:
+        pages_needed = min(pages_needed, max_pages)
     
-    for page in range(pages_needed):
+    for page in range(start_page, start_page + pages_needed):
         start_index = page * 10
         
         params = {
@@ -195,68 +336,56 @@ async def scrape_query(
         }
         
         try:
-            # Get proxy
-            proxy_dict = proxy_rotator.get_proxy_dict()
+            data = await fetch_page(session, params, limiter, proxy_rotator)
+            if data is None:
+                break
+            
+            results = data.get("organic_results", [])
             
-            async with session.get(
-                "https://serpapi.com/search",
-                params=params,
-                proxy=proxy_dict.get("http") if proxy_dict else None,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as resp:
+            if not results:
+                break
+            
+            for result in results:
+                # Stop if we hit the limit
+                if len(profiles) >= results_limit:
+                    break
                 
-                if resp.status == 429:  # Rate limited
-                    logger.warning(f"[SerpAPI] Rate limited. Waiting 60s...")
-                    await asyncio.sleep(60)
+                link = result.get("link", "")
+                # The regex in extract_domain_from_link is the filter
+                domain = extract_domain_from_link(link)
+                if not domain:
                     continue
                 
-                resp.raise_for_status()
-                data = await resp.json()
-                
-                results = data.get("organic_results", [])
-                
-                if not results:
-                    break
-                
-                for result in results:
-                    # Stop if we hit the limit
-                    if len(profiles) >= results_limit:
+                if budget is not None and not budget.take(domain):
+                    if budget.remaining <= 0:
                         break
-                    
-                    link = result.get("link", "")
-                    if "linkedin.com/in/" not in link:
-                        continue
-                    
-                    title = result.get("title", "")
-                    first_name, last_name = extract_name_from_title(title)
-                    job_title, company = extract_role_and_company(title)
-                    domain = extract_domain_from_link(link)
-                    
-                    if not domain:
-                        continue
-                    
-                    profiles.append({
-                        "first_name": first_name,
-                        "last_name": last_name,
-                        "linkedin_url": f"https://{domain}",
-                        "title": title,
-                        "job_title": job_title,
-                        "company": company,
-                        "source_query": query[:50]
-                    })
+                    continue
                 
-                # Stop if we hit the limit
-                if len(profiles) >= results_limit:
-                    break
+                title = result.get("title", "")
+                job_title, company = extract_role_and_company(title)
                 
+                # Row tuple in PROFILE_COLUMNS order (the https:// prefix is
+                # added to the whole linkedin_url column in scrape_bulk_async)
+                profiles.append((
+                    domain,
+                    title,
+                    job_title,
+                    company,
+                    query[:50],
+                ))
+            
+            # Stop if we hit the limit
+            if len(profiles) >= results_limit:
+                break
+            if budget is not None and budget.remaining <= 0:
+                break
+            
         except asyncio.TimeoutError:
             logger.warning(f"[Query timeout] {query[:50]}...")
             continue
         except Exception as e:
             logger.error(f"[Query error] {query[:50]}: {e}")
             continue
-        
-        await asyncio.sleep(delay)
     
     return profiles
 
@@ -270,10 +399,19 @@ async def scrape_bulk_async(
 ) -> pd.DataFrame:
     """
     Scrape all queries concurrently with async workers.
-    Distributes total_limit equally across queries.
+    Distributes total_limit equally across queries; budget left unused by
+    low-yield queries is then taken up by queries that filled their share.
     """
     proxies = config.get("scraping", {}).get("proxies", [])
     concurrent_workers = config.get("scraping", {}).get("concurrent_workers", 4)
+    max_extra_pages = int(config.get("scraping", {}).get("max_extra_pages", 5))
+    
+    # Identical query strings return identical SerpAPI pages; scrape each
+    # once (order preserved) and spread the limit over the unique ones
+    unique_queries = list(dict.fromkeys(queries))
+    if len(unique_queries) < len(queries):
+        logger.info(f"🔁 Skipping {len(queries) - len(unique_queries)} duplicate queries")
+    queries = unique_queries
     
     # Calculate results per query
     results_per_query = math.ceil(total_limit / len(queries))
@@ -282,49 +420,117 @@ async def scrape_bulk_async(
     
     proxy_rotator = ProxyRotator(proxies)
     
-    async with aiohttp.ClientSession() as session:
-        # Create tasks for each query
-        tasks = [
-            scrape_query(
-                session, query, api_key, results_per_query, delay, proxy_rotator, config
-            )
-            for query in queries
-        ]
+    sem = asyncio.Semaphore(concurrent_workers)
+    # Same overall pace as each worker sleeping `delay` after every page,
+    # but spread evenly so no worker idles while the budget has room
+    limiter = LeakyBucket(delay / max(concurrent_workers, 1))
+    
+    # One keep-alive pool for the run: serpapi.com connections and DNS are
+    # reused across pages; proxies are still set per request
+    connector = aiohttp.TCPConnector(
+        limit=concurrent_workers * 2,
+        limit_per_host=concurrent_workers,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+    )
+    
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30),
+    ) as session:
+        async def bounded(i: int, results_limit: int, **kwargs):
+            # A worker slot frees up as soon as any query finishes
+            async with sem:
+                try:
+                    return i, await scrape_query(
+                        session, queries[i], api_key, results_limit, limiter, proxy_rotator, config,
+                        **kwargs,
+                    )
+                except Exception as e:
+                    return i, e
         
-        # Run with limited concurrency
-        results = []
-        for i in range(0, len(tasks), concurrent_workers):
-            batch = tasks[i:i + concurrent_workers]
-            batch_results = await asyncio.gather(*batch, return_exceptions=True)
+        async def run_round(jobs: List[Tuple[int, int, Dict[str, Any]]], label: str):
+            # All jobs start up front, gated by the semaphore
+            tasks = [asyncio.create_task(bounded(i, limit, **kwargs)) for i, limit, kwargs in jobs]
             
-            for result in batch_results:
+            per_query: List[List[Tuple[str, ...]]] = [[] for _ in queries]
+            for done, fut in enumerate(asyncio.as_completed(tasks), 1):
+                i, result = await fut
                 if isinstance(result, Exception):
                     logger.error(f"Task failed: {result}")
-                    continue
-                results.extend(result)
+                else:
+                    per_query[i] = result
+                
+                if done % concurrent_workers == 0 or done == len(tasks):
+                    logger.info(f"✅ Completed {done}/{len(tasks)} {label}")
             
-            logger.info(f"✅ Completed {min(i + concurrent_workers, len(tasks))}/{len(tasks)} queries")
+            # Query order (not completion order) decides which duplicate is kept
+            return [profile for profiles in per_query for profile in profiles], per_query
         
-        # Convert to DataFrame
-        df = pd.DataFrame(results)
+        results, per_query = await run_round(
+            [(i, results_per_query, {}) for i in range(len(queries))], "queries"
+        )
+        
+        # Work stealing: queries that filled their share keep paging for
+        # whatever the run is short. They resume after the last page already
+        # fetched: re-fetching a partial page would cost a paid SerpAPI call
+        # for a handful of leftover results
+        seen = {profile[0] for profile in results}
+        shortfall = total_limit - len(seen)
+        abundant = [i for i, profiles in enumerate(per_query) if len(profiles) >= results_per_query]
+        if shortfall > 0 and abundant and max_extra_pages > 0:
+            logger.info(f"♻️  {shortfall} profiles short; {len(abundant)} queries continue")
+            budget = ScrapeBudget(shortfall, seen)
+            follow_up = {
+                "start_page": math.ceil(results_per_query / 10),
+                "max_pages": max_extra_pages,
+                "budget": budget,
+            }
+            extra, _ = await run_round(
+                [(i, shortfall, follow_up) for i in abundant], "follow-up queries"
+            )
+            results.extend(extra)
+        
+        # Convert to DataFrame in one pass over the row tuples; Arrow-backed
+        # strings keep the text in packed UTF-8 buffers, not per-cell objects
+        df = pd.DataFrame.from_records(results, columns=PROFILE_COLUMNS).astype(
+            "string[pyarrow]", copy=False
+        )
         
         if df.empty:
             return df
         
-        # Dedupe by LinkedIn URL
-        df = df.drop_duplicates(subset=["linkedin_url"], keep="first")
+        # Dedupe by LinkedIn URL (on uint64 hashes, keep first)
+        df = df[~url_keys(df["linkedin_url"]).duplicated().to_numpy()]
+
+        # Names for all rows in one vectorized pass over the titles
+        names = extract_names_from_titles(df["title"]).astype("string[pyarrow]")
+        df.insert(0, "first_name", names["first_name"])
+        df.insert(1, "last_name", names["last_name"])
         
         # LIMIT TO EXACTLY total_limit
         if len(df) > total_limit:
             logger.warning(f"⚠️  Scraped {len(df)} profiles, limiting to {total_limit}")
             df = df.head(total_limit)
         
+        # Full URLs in one Arrow concatenation over the column
+        df["linkedin_url"] = "https://" + df["linkedin_url"]
+        
         return df
 
 # ============================================================================
 # Google Sheet Deduplication
 # ============================================================================
 
+def url_keys(urls: pd.Series) -> pd.Series:
+    """
+    Hash URLs to uint64 keys so dedup and sheet matching run on pandas'
+    integer hashtable instead of boxing Python strings.
+    """
+    return pd.util.hash_pandas_object(
+        urls.astype("string[pyarrow]"), index=False
+    )
+
 def dedupe_against_sheet(
     df: pd.DataFrame,
     config: Dict[str, Any]
@@ -340,18 +546,29 @@ def dedupe_against_sheet(
     
     try:
         logger.info(f"📥 Fetching existing leads from Google Sheet...")
-        existing_df = pd.read_csv(sheet_url)
+        try:
+            # Only the dedup key, parsed by Arrow's multithreaded reader
+            existing_df = pd.read_csv(
+                sheet_url,
+                usecols=["linkedin_url"],
+                engine="pyarrow",
+                dtype={"linkedin_url": "string[pyarrow]"},
+            )
+        except (KeyError, ValueError):
+            # Column missing (Arrow raises KeyError) or export Arrow can't
+            # parse: full read, and the column check below decides
+            existing_df = pd.read_csv(sheet_url)
         
         if "linkedin_url" not in existing_df.columns:
             logger.warning("Google Sheet missing 'linkedin_url' column - skipping dedup")
             return df
         
-        existing_urls = set(existing_df["linkedin_url"].dropna())
-        logger.info(f"📋 Found {len(existing_urls)} existing leads in sheet")
+        existing_keys = url_keys(existing_df["linkedin_url"].dropna()).unique()
+        logger.info(f"📋 Found {len(existing_keys)} existing leads in sheet")
         
-        # Filter out duplicates
+        # Filter out duplicates (anti-join on hashed linkedin_url, one copy)
         before_count = len(df)
-        df = df[~df["linkedin_url"].isin(existing_urls)]
+        df = df[~url_keys(df["linkedin_url"]).isin(existing_keys).to_numpy()]
         removed_count = before_count - len(df)
         
         logger.info(f"🗑️  Removed {removed_count} duplicates")
@@ -367,17 +584,18 @@ def dedupe_against_sheet(
 # Main Scraper Entry Point
 # ============================================================================
 
-def run_scraper() -> pd.DataFrame:
+def run_scraper(config: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
     Main scraper pipeline:
-    1. Load config and queries
+    1. Load config (unless passed in) and queries
     2. Scrape LinkedIn via SerpAPI (concurrent + proxies)
     3. Dedupe by LinkedIn URL
     4. Dedupe against Google Sheet
     5. Export CSV
     6. LIMIT TO 400 PEOPLE TOTAL
     """
-    config = load_config()
+    if config is None:
+        config = load_config()
     queries = load_queries()
     
     if not queries:
@@ -406,7 +624,15 @@ def run_scraper() -> pd.DataFrame:
     logger.info("-" * 80)
     logger.info(f"🎯 TARGET: {TOTAL_PEOPLE_LIMIT} people (distributed across {len(queries)} queries)")
     
-    df = asyncio.run(scrape_bulk_async(queries, api_key, TOTAL_PEOPLE_LIMIT, delay, config))
+    # uvloop for the scrape only (policy swap rather than asyncio.Runner's
+    # loop_factory, which needs Python 3.11)
+    default_policy = asyncio.get_event_loop_policy()
+    if ScrapeLoopPolicy is not None:
+        asyncio.set_event_loop_policy(ScrapeLoopPolicy())
+    try:
+        df = asyncio.run(scrape_bulk_async(queries, api_key, TOTAL_PEOPLE_LIMIT, delay, config))
+    finally:
+        asyncio.set_event_loop_policy(default_policy)
     
     if df.empty:
         logger.error("❌ No profiles scraped")
@@ -434,7 +660,8 @@ def run_scraper() -> pd.DataFrame:
     output_dir.mkdir(exist_ok=True)
     
     output_path = output_dir / "scraper_output.csv"
-    df.to_csv(output_path, index=False)
+    # Arrow's C++ CSV writer; the text columns are already Arrow-backed
+    write_csv(df, output_path)
     
     logger.info(f"✅ Exported {len(df)} profiles → {output_path}")
     logger.info("")
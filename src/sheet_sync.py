@@ -3,24 +3,37 @@
 """
 Google Sheets Sync v2 (Apps Script WebApp)
 
-- Loads final CSV from data/enriched_with_emails.csv
+- Loads final CSV (or .parquet) from data/enriched_with_emails.csv
 - Normalizes to the Google Sheet schema:
   NAME, EMAIL, ROLE, COMPANY, SOURCE, DATE, STATUS, TEMPLATE USED, NOTES
 - Fetches existing rows from Apps Script GET endpoint
 - Upserts by EMAIL:
     - New email  -> append full row (STATUS="Pending", TEMPLATE USED="")
     - Existing   -> update only backend-owned fields, keep STATUS / TEMPLATE USED
-- Sends rows in batches to POST endpoint
+- Sends rows in batches to POST endpoint, as {"data": [row dicts]} or, with
+  google_sheets.columnar_payload, as {"columns": [...], "rows": [[...]]}
 """
 
-import json
+import random
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 
 import pandas as pd
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads  # SIMD JSON codec
+except ImportError:  # pragma: no cover - orjson not installed
+    import json
+    from json import loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 BASE_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = BASE_DIR.parent
@@ -32,6 +45,8 @@ BATCH_SIZE = 50
 POST_TIMEOUT = 20
 RETRIES = 3
 RETRY_DELAY = 2
+MAX_RETRY_DELAY = 60
+POST_WORKERS = 8  # batches in flight at once
 
 # Sheet header names (must match Google Sheet exactly)
 SHEET_COLUMNS = [
@@ -46,17 +61,81 @@ SHEET_COLUMNS = [
     "NOTES",
 ]
 
+# Pipeline output columns mapped onto the sheet schema in _load_local_rows
+LOCAL_COLUMNS = [
+    "first_name",
+    "last_name",
+    "name",
+    "email",
+    "job_title",
+    "company",
+    "source",
+    "date",
+    "linkedin_url",
+]
+
 # Columns owned by backend (safe to overwrite on resync)
 BACKEND_OWNED = {"NAME", "EMAIL", "ROLE", "COMPANY", "SOURCE", "DATE", "NOTES"}
 
 # Columns owned by outreach / n8n workflow (never overwrite here)
 WORKFLOW_OWNED = {"STATUS", "TEMPLATE USED"}
 
+# Backend columns compared to decide whether an update changes anything
+# (DATE is stamped on every sync, so it alone never justifies a POST)
+CONTENT_COLUMNS = sorted(BACKEND_OWNED - {"DATE"})
+
+
+def _retry_after(value: str | None, default: float) -> float:
+    """Seconds from a Retry-After header (delta form), else the default."""
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_DELAY)
+    except (TypeError, ValueError):
+        return default
+
+
+def _norm_emails(emails: pd.Series) -> pd.Series:
+    """Trimmed, lower-cased emails via Arrow's UTF-8 kernels (no-op cast if
+    the column is already Arrow-backed)."""
+    return emails.astype("string[pyarrow]").str.strip().str.lower()
+
 
 class SheetSync:
-    def __init__(self, webhook_url: str) -> None:
+    def __init__(self, webhook_url: str, columnar: bool = False) -> None:
         self.webhook_url = webhook_url
+        # {"columns": [...], "rows": [[...]]} payloads instead of one dict per
+        # row; only enable once the Apps Script doPost understands them
+        self.columnar = columnar
         self.session = requests.Session()
+        # One pooled connection per POST worker thread; transport-level
+        # retries happen in urllib3, not in _post_batch.
+        # No read retries: a POST that timed out may already have been
+        # applied, and replaying it duplicates rows without an EMAIL
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=POST_WORKERS,
+            max_retries=Retry(
+                total=RETRIES,
+                read=0,
+                backoff_factor=RETRY_DELAY,
+                # 429 is left to _post_batch, which honours Retry-After with
+                # jittered backoff; retrying it here too multiplied the waits.
+                # urllib3 retries any 429 carrying Retry-After unless told
+                # not to, whatever status_forcelist says
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+                respect_retry_after_header=False,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+        # Last GET result and its ETag, for conditional re-fetches
+        self._etag: str | None = None
+        self._sheet_df: pd.DataFrame | None = None
+        # Last normalized local file, keyed by (path, mtime_ns, size)
+        self._local_key: tuple | None = None
+        self._local_df: pd.DataFrame | None = None
         logger.info("[SheetSync] Initialized (single webhook_url for POST/GET)")
 
     # ------------------------------------------------------------------
@@ -68,44 +147,57 @@ class SheetSync:
             logger.error(f"[SheetSync] {path} not found")
             return pd.DataFrame()
 
-        df = pd.read_csv(path, dtype=str).fillna("")
+        st = path.stat()
+        key = (path.resolve(), st.st_mtime_ns, st.st_size)
+        if key == self._local_key:
+            logger.info(
+                f"[SheetSync] {path} unchanged, reusing {len(self._local_df)} rows"
+            )
+            return self._local_df
+
+        if path.suffix == ".parquet":
+            df = pd.read_parquet(path).astype("string").fillna("")
+        else:
+            # Only the mapped columns, parsed by the multithreaded Arrow reader
+            header = pd.read_csv(path, nrows=0).columns
+            usecols = [c for c in LOCAL_COLUMNS if c in header]
+            try:
+                df = pd.read_csv(
+                    path, engine="pyarrow", usecols=usecols, dtype="string[pyarrow]"
+                )
+            except ValueError:
+                # Ragged / malformed rows: the C parser is more forgiving
+                df = pd.read_csv(path, usecols=usecols, dtype=str)
+            df = df.fillna("")
         logger.info(f"[SheetSync] Loaded {len(df)} rows from {path}")
 
-        def build_name(row: Dict[str, Any]) -> str:
-            first = str(row.get("first_name", "")).strip()
-            last = str(row.get("last_name", "")).strip()
-            if first or last:
-                return f"{first} {last}".strip()
-            return str(row.get("name", "")).strip()
-
-        def build_notes(row: Dict[str, Any]) -> str:
-            # Use LinkedIn URL as NOTES
-            return str(row.get("linkedin_url", "")).strip()
-
-        records: List[Dict[str, Any]] = []
-        for _, r in df.iterrows():
-            row = r.to_dict()
-
-            rec: Dict[str, Any] = {}
-            rec["NAME"] = build_name(row)
-            rec["EMAIL"] = str(row.get("email", "")).strip()
-            rec["ROLE"] = str(row.get("job_title", "")).strip()
-            rec["COMPANY"] = str(row.get("company", "")).strip()
-            rec["SOURCE"] = str(row.get("source", "Hunter.io")).strip() or "Hunter.io"
-            rec["DATE"] = str(
-                row.get("date", pd.Timestamp.utcnow().isoformat())
-            ).strip()
-            rec["STATUS"] = "Pending"  # default for new leads
-            rec["TEMPLATE USED"] = ""  # workflow will fill later
-            rec["NOTES"] = build_notes(row)
-
-            for col in SHEET_COLUMNS:
-                rec.setdefault(col, "")
-
-            records.append(rec)
-
-        df_sheet = pd.DataFrame(records, columns=SHEET_COLUMNS).fillna("")
+        def column(name: str) -> pd.Series:
+            # Stripped source column, or blanks if the CSV doesn't have it
+            if name in df.columns:
+                return df[name].str.strip()
+            return pd.Series("", index=df.index, dtype=object)
+
+        first, last = column("first_name"), column("last_name")
+        name = (first + " " + last).str.strip()
+        source = column("source")
+        date = column("date")
+
+        df_sheet = pd.DataFrame(
+            {
+                "NAME": name.where(name.ne(""), column("name")),
+                "EMAIL": column("email"),
+                "ROLE": column("job_title"),
+                "COMPANY": column("company"),
+                "SOURCE": source.where(source.ne(""), "Hunter.io"),
+                "DATE": date.where(date.ne(""), pd.Timestamp.utcnow().isoformat()),
+                "STATUS": "Pending",  # default for new leads
+                "TEMPLATE USED": "",  # workflow will fill later
+                "NOTES": column("linkedin_url"),  # LinkedIn URL as NOTES
+            },
+            index=df.index,
+        ).reindex(columns=SHEET_COLUMNS, fill_value="")
         logger.info(f"[SheetSync] Normalized {len(df_sheet)} rows to sheet schema")
+        self._local_key, self._local_df = key, df_sheet
         return df_sheet
 
     # ------------------------------------------------------------------
@@ -123,20 +215,40 @@ class SheetSync:
             )
             return pd.DataFrame()
 
+        headers = {}
+        if self._etag and self._sheet_df is not None:
+            headers["If-None-Match"] = self._etag
+
         try:
-            r = self.session.get(self.webhook_url, timeout=POST_TIMEOUT)
+            r = self.session.get(self.webhook_url, headers=headers, timeout=POST_TIMEOUT)
+            if r.status_code == 304:
+                logger.info(
+                    f"[SheetSync] Sheet unchanged since last fetch "
+                    f"({len(self._sheet_df)} existing rows)"
+                )
+                return self._sheet_df
+
             if r.status_code != 200:
                 logger.warning(
                     f"[SheetSync] GET {self.webhook_url} returned {r.status_code}"
                 )
                 return pd.DataFrame()
 
-            data = r.json()
+            data = json_loads(r.content)
             if isinstance(data, dict) and "data" in data:
                 data = data["data"]
 
-            df = pd.DataFrame(data, dtype=str).fillna("")
+            # Fixed schema: no column inference over the decoded records
+            df = (
+                pd.DataFrame.from_records(data, columns=SHEET_COLUMNS)
+                .fillna("")
+                .astype("string[pyarrow]")
+            )
             logger.info(f"[SheetSync] Sheet currently has {len(df)} existing rows")
+
+            # Servers without ETag support simply never get a conditional GET
+            self._etag = r.headers.get("ETag")
+            self._sheet_df = df
             return df
 
         except Exception as e:
@@ -146,99 +258,142 @@ class SheetSync:
     # ------------------------------------------------------------------
     # Upsert by EMAIL (preserve workflow-owned columns)
     # ------------------------------------------------------------------
-    def _compute_changes(
+    def _iter_change_batches(
         self, df_local: pd.DataFrame, df_sheet: pd.DataFrame
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[List[Any]]:
+        """Yield the upsert rows BATCH_SIZE at a time, ready to POST."""
+        # Batches are POSTed concurrently, so two rows with the same email
+        # in different batches would both be inserted; last local row wins
+        local_emails = _norm_emails(df_local["EMAIL"])
+        keep = local_emails.fillna("").eq("") | ~local_emails.duplicated(keep="last")
+        if not keep.all():
+            logger.info(
+                f"[SheetSync] Dropped {int((~keep).sum())} local rows with a repeated EMAIL"
+            )
+            df_local, local_emails = df_local[keep], local_emails[keep]
+
         if df_sheet.empty:
             logger.info("[SheetSync] Sheet empty — all rows are new inserts")
-            return df_local.to_dict(orient="records")
+            yield from self._batches(df_local)
+            return
 
-        sheet = df_sheet.copy()
-        local = df_local.copy()
+        # Normalized join key for the sheet; neither frame is copied
+        sheet_emails = _norm_emails(df_sheet["EMAIL"])
 
-        sheet["email_norm"] = (
-            sheet.get("EMAIL", "").astype(str).str.strip().str.lower()
+        # Last sheet row wins for a repeated email; blank emails never match
+        existing = df_sheet.reindex(columns=SHEET_COLUMNS, fill_value="").set_axis(
+            pd.Index(sheet_emails, name="email_norm")
+        )
+        existing = existing[
+            (existing.index != "") & ~existing.index.duplicated(keep="last")
+        ]
+        # One hashed gather: the matching sheet row (or NaN) per local row
+        found = existing.reindex(local_emails).set_axis(df_local.index)
+        is_update = local_emails.isin(existing.index)
+
+        # Drop updates whose backend content already matches the sheet; a
+        # missing local value and a blank sheet cell are the same content
+        local_hash = pd.util.hash_pandas_object(
+            df_local[CONTENT_COLUMNS].astype("string").fillna(""), index=False
         )
-        local["email_norm"] = (
-            local.get("EMAIL", "").astype(str).str.strip().str.lower()
+        sheet_hash = pd.util.hash_pandas_object(
+            found[CONTENT_COLUMNS].astype("string").fillna(""), index=False
+        )
+        unchanged = is_update & local_hash.eq(sheet_hash)
+        send = ~unchanged
+
+        # Existing email -> keep the workflow-owned columns from the sheet;
+        # everything else in SHEET_COLUMNS is backend-owned and comes from local
+        rows = df_local.loc[send, SHEET_COLUMNS].assign(
+            **{
+                col: found.loc[send, col].where(is_update[send], df_local.loc[send, col])
+                for col in WORKFLOW_OWNED
+            }
         )
 
-        existing_by_email: Dict[str, Dict[str, Any]] = {}
-        for _, r in sheet.iterrows():
-            email = r.get("email_norm", "")
-            if email:
-                existing_by_email[email] = r.to_dict()
-
-        changes: List[Dict[str, Any]] = []
-        inserts, updates = 0, 0
-
-        for _, r in local.iterrows():
-            row = r.to_dict()
-            email_norm = row.get("email_norm", "")
-            if not email_norm:
-                changes.append({k: row.get(k, "") for k in SHEET_COLUMNS})
-                inserts += 1
-                continue
-
-            if email_norm not in existing_by_email:
-                changes.append({k: row.get(k, "") for k in SHEET_COLUMNS})
-                inserts += 1
-            else:
-                existing = existing_by_email[email_norm]
-                merged: Dict[str, Any] = {}
-                for col in SHEET_COLUMNS:
-                    if col in WORKFLOW_OWNED:
-                        merged[col] = existing.get(col, "")
-                    elif col in BACKEND_OWNED:
-                        merged[col] = row.get(col, "")
-                    else:
-                        merged[col] = row.get(col, existing.get(col, ""))
-                changes.append(merged)
-                updates += 1
+        updates = int(is_update.sum()) - int(unchanged.sum())
+        inserts = len(rows) - updates
 
         logger.info(
-            f"[SheetSync] Upsert plan: {inserts} inserts, {updates} updates (by EMAIL)"
+            f"[SheetSync] Upsert plan: {inserts} inserts, {updates} updates, "
+            f"{int(unchanged.sum())} unchanged skipped (by EMAIL)"
         )
-        return changes
+        yield from self._batches(rows)
+
+    def _batches(self, rows: pd.DataFrame) -> Iterator[List[Any]]:
+        # Column arrays are unboxed once; only one batch of rows exists at a
+        # time, zipped straight from them (no per-slice to_dict). Rows are
+        # dicts, or plain lists in SHEET_COLUMNS order for columnar payloads
+        cols = [rows[c].to_numpy(dtype=object, na_value="") for c in SHEET_COLUMNS]
+        for start in range(0, len(rows), BATCH_SIZE):
+            stop = start + BATCH_SIZE
+            chunk = zip(*(c[start:stop] for c in cols))
+            if self.columnar:
+                yield [list(values) for values in chunk]
+            else:
+                yield [dict(zip(SHEET_COLUMNS, values)) for values in chunk]
 
     # ------------------------------------------------------------------
     # POST batch to Apps Script
     # ------------------------------------------------------------------
-    def _post_batch(self, batch: List[Dict[str, Any]]) -> bool:
+    def _post_batch(self, batch: List[Any]) -> bool:
         if not batch:
             return True
 
-        payload = json.dumps({"data": batch})
+        if self.columnar:
+            # Header names once per batch instead of once per row
+            payload = json_dumps({"columns": SHEET_COLUMNS, "rows": batch})
+        else:
+            payload = json_dumps({"data": batch})
+
+        delay = RETRY_DELAY
         for attempt in range(1, RETRIES + 1):
             try:
+                # Connect errors and 5xx are retried by the session adapter
                 r = self.session.post(
-                    self.webhook_url,
-                    data=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=POST_TIMEOUT,
+                    self.webhook_url, data=payload, timeout=POST_TIMEOUT
                 )
-                logger.debug(
-                    f"[SheetSync] POST attempt {attempt} → "
-                    f"status={r.status_code} size={len(payload)}"
-                )
-                if r.status_code == 200:
-                    body: Dict[str, Any] = {}
-                    try:
-                        body = r.json()
-                    except Exception:
-                        body = {}
-
-                    if isinstance(body, dict) and body.get("status") == "error":
-                        logger.warning(
-                            f"[SheetSync] Apps Script logical error: "
-                            f"{body.get('message')}"
-                        )
-                    else:
-                        logger.info(f"[SheetSync] Batch ({len(batch)}) synced")
-                        return True
             except Exception as e:
-                logger.warning(f"[SheetSync] POST fail attempt {attempt}: {e}")
-                time.sleep(RETRY_DELAY)
+                logger.error(f"[SheetSync] POST failed after retries: {e}")
+                return False
+
+            logger.debug(
+                f"[SheetSync] POST attempt {attempt} → "
+                f"status={r.status_code} size={len(payload)}"
+            )
+            if r.status_code == 429:
+                # Quota exhausted; back off and retry the batch
+                wait_s = _retry_after(r.headers.get("Retry-After"), delay)
+                logger.warning(
+                    f"[SheetSync] Rate limited (attempt {attempt}), "
+                    f"retrying in {wait_s:.1f}s"
+                )
+            elif r.status_code != 200:
+                logger.error(f"[SheetSync] Batch failed with status {r.status_code}")
+                return False
+            else:
+                body: Dict[str, Any] = {}
+                try:
+                    body = json_loads(r.content)
+                except Exception:
+                    body = {}
+
+                if not (isinstance(body, dict) and body.get("status") == "error"):
+                    logger.info(f"[SheetSync] Batch ({len(batch)}) synced")
+                    return True
+
+                # Apps Script reports quota / lock failures as 200 + error
+                wait_s = delay
+                logger.warning(
+                    f"[SheetSync] Apps Script logical error (attempt {attempt}): "
+                    f"{body.get('message')}"
+                )
+
+            if attempt < RETRIES:
+                time.sleep(wait_s)
+                # Decorrelated jitter keeps concurrent workers from retrying
+                # in lockstep
+                delay = min(random.uniform(RETRY_DELAY, delay * 3), MAX_RETRY_DELAY)
 
         logger.error("[SheetSync] Batch failed after retries")
         return False
@@ -259,18 +414,27 @@ class SheetSync:
             return 0
 
         df_sheet = self._fetch_existing()
-        changes = self._compute_changes(df_local, df_sheet)
 
-        if not changes:
+        def post(batch: List[Any]) -> int:
+            return len(batch) if self._post_batch(batch) else 0
+
+        # Batches are independent upserts, so they go out concurrently; at
+        # most POST_WORKERS are built and in flight at any time
+        sent, planned = 0, 0
+        with ThreadPoolExecutor(max_workers=POST_WORKERS) as pool:
+            in_flight = set()
+            for batch in self._iter_change_batches(df_local, df_sheet):
+                if len(in_flight) >= POST_WORKERS:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    sent += sum(f.result() for f in done)
+                in_flight.add(pool.submit(post, batch))
+                planned += len(batch)
+            sent += sum(f.result() for f in wait(in_flight).done)
+
+        if not planned:
             logger.info("[SheetSync] Nothing to push (no inserts/updates)")
             return 0
 
-        sent = 0
-        for i in range(0, len(changes), BATCH_SIZE):
-            batch = changes[i : i + BATCH_SIZE]
-            if self._post_batch(batch):
-                sent += len(batch)
-
         logger.info(f"[SheetSync] Sync complete. Total rows sent: {sent}")
         return sent
 
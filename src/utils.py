@@ -2,12 +2,21 @@ import yaml
 from pathlib import Path
 from loguru import logger
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 # ------------------------------------------------------
 # Logging Configuration
 # ------------------------------------------------------
 LOG_PATH = Path("data/logs.txt")
-logger.add(LOG_PATH, rotation="1 MB", retention=5, level="INFO")
+
+
+def setup_file_logging(level: str = "INFO") -> int:
+    """
+    Also log to LOG_PATH (rotated at 1 MB). Called by CLI entry points, not
+    at import, so importing a pipeline module never adds a sink.
+    """
+    return logger.add(LOG_PATH, rotation="1 MB", retention=5, level=level)
 
 
 # ------------------------------------------------------
@@ -41,12 +50,27 @@ def save_df(df: pd.DataFrame, path: str | Path):
     try:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(path, index=False)
+        write_csv(df, path)
         logger.info(f"[DATA] Saved → {path} ({len(df)} rows)")
     except Exception as e:
         logger.error(f"[DATA] Save failed for {path}: {e}")
 
 
+def write_csv(df: pd.DataFrame, path: str | Path):
+    """
+    CSV via pyarrow's buffered C++ writer; pandas handles what Arrow can't
+    convert (e.g. object columns mixing types).
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df.to_csv(path, index=False)
+        return
+    pa_csv.write_csv(
+        table, str(path), write_options=pa_csv.WriteOptions(batch_size=8192)
+    )
+
+
 def read_df(path: str | Path):
     """
     Load CSV safely. Returns empty DF if missing.
@@ -57,7 +81,12 @@ def read_df(path: str | Path):
         return pd.DataFrame()
 
     try:
-        return pd.read_csv(path)
+        # Multithreaded Arrow reader, Arrow-backed columns; the C parser
+        # still handles files Arrow rejects (e.g. ragged rows)
+        try:
+            return pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow")
+        except ValueError:
+            return pd.read_csv(path)
     except Exception as e:
         logger.error(f"[DATA] Failed loading {path}: {e}")
         return pd.DataFrame()
\ No newline at end of file
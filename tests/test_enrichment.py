@@ -0,0 +1,265 @@
+"""
+Tests for the concurrent Hunter.io dispatch, against a local fake API.
+
+Run with: python -m unittest discover -s tests -t .
+"""
+
+import asyncio
+import tempfile
+import threading
+import unittest
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from aiohttp import web
+
+from src.enrichment import HunterClient, _read_profiles, dispatch_lookups
+
+
+def finder_found(request: web.Request) -> web.Response:
+    """email-finder that always answers with a 90% match."""
+    q = request.query
+    email = f"{q['first_name']}.{q['last_name']}@example.com".lower()
+    return web.json_response({"data": {"email": email, "score": 90}})
+
+
+class FakeHunter:
+    """Serves /email-finder and /domain-search on an ephemeral port."""
+
+    def __init__(
+        self,
+        finder: Callable[[web.Request], web.Response] = finder_found,
+        domain_search: Optional[Callable[[web.Request], web.Response]] = None,
+    ):
+        self.calls: Dict[str, int] = {"finder": 0, "domain": 0}
+        self.peers: set = set()  # client (host, port) pairs seen
+        self._finder = finder
+        self._domain_search = domain_search
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    async def _handle_finder(self, request: web.Request) -> web.Response:
+        self.calls["finder"] += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        return self._finder(request)
+
+    async def _handle_domain(self, request: web.Request) -> web.Response:
+        self.calls["domain"] += 1
+        return self._domain_search(request)
+
+    async def __aenter__(self) -> "FakeHunter":
+        app = web.Application()
+        app.router.add_get("/email-finder", self._handle_finder)
+        if self._domain_search is not None:
+            app.router.add_get("/domain-search", self._handle_domain)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._runner.cleanup()
+
+
+@contextmanager
+def serve_in_thread(server: FakeHunter) -> Iterator[FakeHunter]:
+    """Run the fake API on its own loop, for the blocking client path."""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run() -> None:
+        loop.run_until_complete(server.__aenter__())
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait()
+    try:
+        yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.__aexit__(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class DispatchLookupsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def make_client(self, server: FakeHunter, keys: int = 1, **enr) -> HunterClient:
+        config = {"enrichment": {"cache_dir": self._tmp.name, **enr}}
+        api_keys = [
+            {"key": f"key{i}", "credits": 100, "status": "active"}
+            for i in range(keys)
+        ]
+        client = HunterClient(api_keys, config)
+        client._finder_url = f"{server.base_url}/email-finder"
+        client._domain_search_url = f"{server.base_url}/domain-search"
+        self.addCleanup(client.close)
+        return client
+
+    def dispatch(
+        self,
+        server: FakeHunter,
+        pending: List[tuple],
+        budget: int,
+        max_concurrency: int = 4,
+        **enr: Any,
+    ) -> Dict[Any, Optional[Dict[str, Any]]]:
+        async def run():
+            async with server:
+                client = self.make_client(server, **enr)
+                return await dispatch_lookups(
+                    client,
+                    pending,
+                    budget,
+                    max_concurrency=max_concurrency,
+                    requests_per_second=1000,
+                )
+
+        return asyncio.run(run())
+
+    def test_bad_domain_search_falls_back_to_finder(self):
+        server = FakeHunter(
+            domain_search=lambda request: web.Response(text="<html>oops</html>")
+        )
+        pending = [
+            (0, "Ann", "Smith", "acme.com", ""),
+            (1, "Bob", "Jones", "acme.com", ""),
+        ]
+        results = self.dispatch(server, pending, budget=10)
+
+        self.assertEqual(server.calls, {"finder": 2, "domain": 1})
+        self.assertTrue(all(r and r["found"] for r in results.values()))
+
+    def test_budget_caps_lookups(self):
+        server = FakeHunter()
+        pending = [(i, "Ann", f"Smith{i}", f"site{i}.com", "") for i in range(5)]
+        results = self.dispatch(server, pending, budget=2)
+
+        self.assertEqual(server.calls["finder"], 2)
+        self.assertEqual(sum(1 for r in results.values() if r and r["found"]), 2)
+
+    def test_rerun_resumes_from_lookup_cache(self):
+        pending = [(i, "Ann", f"Smith{i}", f"site{i}.com", "") for i in range(5)]
+        self.dispatch(FakeHunter(), pending, budget=2)  # interrupted run
+
+        server = FakeHunter()
+        results = self.dispatch(server, pending, budget=4)
+
+        # The two cached answers are reused and count toward the budget
+        self.assertEqual(server.calls["finder"], 2)
+        self.assertEqual(sum(1 for r in results.values() if r and r["found"]), 4)
+
+    def test_shared_domain_is_searched_once(self):
+        def domain_search(request: web.Request) -> web.Response:
+            people = [
+                {"first_name": "Ann", "last_name": "Smith",
+                 "value": "ann@acme.com", "confidence": 95},
+                {"first_name": "Bob", "last_name": "Jones",
+                 "value": "bob@acme.com", "confidence": 95},
+            ]
+            return web.json_response({"data": {"emails": people}})
+
+        server = FakeHunter(domain_search=domain_search)
+        pending = [
+            (0, "Ann", "Smith", "acme.com", ""),
+            (1, "Bob", "Jones", "ACME.com", ""),
+            (2, "Cy", "Other", "acme.com", ""),
+        ]
+        results = self.dispatch(server, pending, budget=10)
+
+        self.assertEqual(server.calls, {"finder": 1, "domain": 1})
+        self.assertEqual(results[0]["email"], "ann@acme.com")
+        self.assertEqual(results[1]["email"], "bob@acme.com")
+        self.assertEqual(results[2]["email"], "cy.other@example.com")
+
+    def test_stops_when_no_key_is_usable(self):
+        server = FakeHunter(
+            finder=lambda request: web.json_response(
+                {"errors": [{"details": "rate limited"}]},
+                status=429,
+                headers={"Retry-After": "0"},
+            )
+        )
+        pending = [(i, "Ann", f"Smith{i}", f"site{i}.com", "") for i in range(30)]
+        results = self.dispatch(server, pending, budget=30, max_concurrency=1)
+
+        self.assertEqual(server.calls["finder"], 1)
+        self.assertEqual(len(results), 30)
+        self.assertTrue(all(r is None for r in results.values()))
+
+
+class FindEmailTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_sequential_lookups_reuse_one_connection(self):
+        with serve_in_thread(FakeHunter()) as server:
+            client = HunterClient(
+                [{"key": "key0", "credits": 100, "status": "active"}],
+                {"enrichment": {"cache_dir": self._tmp.name}},
+            )
+            client._finder_url = f"{server.base_url}/email-finder"
+            try:
+                results = [
+                    client.find_email("Ann", f"Smith{i}", f"site{i}.com")
+                    for i in range(3)
+                ]
+            finally:
+                client.close()
+
+        self.assertTrue(all(r and r["found"] for r in results))
+        self.assertEqual(server.calls["finder"], 3)
+        self.assertEqual(len(server.peers), 1)
+
+    def test_non_json_body_moves_to_next_key(self):
+        def finder(request: web.Request) -> web.Response:
+            if request.query["api_key"] == "key0":
+                return web.Response(text="<html>oops</html>")
+            return finder_found(request)
+
+        with serve_in_thread(FakeHunter(finder=finder)) as server:
+            client = HunterClient(
+                [
+                    {"key": "key0", "credits": 100, "status": "active"},
+                    {"key": "key1", "credits": 50, "status": "active"},
+                ],
+                {"enrichment": {"cache_dir": self._tmp.name}},
+            )
+            client._finder_url = f"{server.base_url}/email-finder"
+            try:
+                result = client.find_email("Ann", "Smith", "acme.com")
+            finally:
+                client.close()
+
+        self.assertEqual(result["email"], "ann.smith@example.com")
+        self.assertEqual(server.calls["finder"], 2)
+        self.assertEqual(client.key_failures, {0: 1})
+
+
+class ReadProfilesTest(unittest.TestCase):
+    def test_empty_text_columns_read_as_strings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "profiles.csv"
+            path.write_text(
+                "first_name,last_name,domain,linkedin_url,title,company,rank\n"
+                "Ann,Smith,acme.com,,,Acme,1\n"
+                "Bob,Jones,,https://linkedin.com/in/bob,,,2\n"
+            )
+            df = _read_profiles(path)
+
+        self.assertEqual(df["title"].dtype, "string[pyarrow]")
+        self.assertEqual(df["company"].dtype, "string[pyarrow]")
+        self.assertEqual(df["rank"].dtype, "int64")
+
+
+if __name__ == "__main__":
+    unittest.main()
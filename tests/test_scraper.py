@@ -0,0 +1,91 @@
+"""
+Tests for the scraper's vectorized parsing and bulk scheduling.
+
+Run with: python -m unittest discover -s tests -t .
+"""
+
+import asyncio
+import unittest
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+import pandas as pd
+
+from src import scraper
+from src.scraper import extract_name_from_title, extract_names_from_titles
+
+
+class ExtractNamesTest(unittest.TestCase):
+    TITLES = [
+        "X\xa0Y - CEO",
+        "John  Doe | VP Engineering",
+        "Ann Marie Lee - Founder",
+        "Solo",
+        "",
+        None,
+    ]
+
+    def test_matches_scalar_parser(self):
+        for dtype in ("string[pyarrow]", object):
+            names = extract_names_from_titles(pd.Series(self.TITLES, dtype=dtype))
+            self.assertEqual(
+                list(names.itertuples(index=False, name=None)),
+                [extract_name_from_title(t) for t in self.TITLES],
+                dtype,
+            )
+
+    def test_nbsp_separates_names(self):
+        names = extract_names_from_titles(
+            pd.Series(["X\xa0Y - CEO"], dtype="string[pyarrow]")
+        )
+        self.assertEqual(names.iloc[0].tolist(), ["X", "Y"])
+
+
+class FakeSerpApi:
+    """Stands in for fetch_page: `yields[query]` profiles, 10 per page."""
+
+    def __init__(self, yields: Dict[str, int]):
+        self.yields = yields
+        self.fetched: List[Tuple[str, int]] = []
+
+    async def __call__(self, session, params, limiter, proxy_rotator) -> Dict[str, Any]:
+        query, start = params["q"], params["start"]
+        self.fetched.append((query, start))
+        stop = min(start + 10, self.yields[query])
+        return {
+            "organic_results": [
+                {
+                    "link": f"https://www.linkedin.com/in/{query}-{k}",
+                    "title": f"First{k} Last{k} - Engineer at Acme",
+                }
+                for k in range(start, stop)
+            ]
+        }
+
+
+class ScrapeBulkTest(unittest.TestCase):
+    def scrape(self, yields: Dict[str, int], total: int) -> Tuple[pd.DataFrame, FakeSerpApi]:
+        serp = FakeSerpApi(yields)
+        with mock.patch.object(scraper, "fetch_page", serp):
+            df = asyncio.run(
+                scraper.scrape_bulk_async(list(yields), "key", total, 0.0, {})
+            )
+        return df, serp
+
+    def test_follow_up_round_fetches_no_page_twice(self):
+        # 15 per query: rich queries stop mid-page 1 in the first round
+        df, serp = self.scrape({"poor": 3, "rich": 100, "rich2": 100}, total=45)
+
+        self.assertEqual(len(serp.fetched), len(set(serp.fetched)))
+        self.assertEqual(len(df), 45)
+
+    def test_names_and_text_are_arrow_strings(self):
+        df, _ = self.scrape({"rich": 30}, total=5)
+
+        self.assertEqual(len(df), 5)
+        self.assertTrue((df.dtypes == "string[pyarrow]").all(), df.dtypes.to_dict())
+        self.assertEqual(df["first_name"].iloc[0], "First0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Tests for the sheet upsert planning and webhook POST retries.
+
+Run with: python -m unittest discover -s tests -t .
+"""
+
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+import pandas as pd
+
+from src import sheet_sync
+from src.sheet_sync import SHEET_COLUMNS, SheetSync
+
+
+def sheet_row(**values: Any) -> Dict[str, Any]:
+    """One row in SHEET_COLUMNS, blanks unless given."""
+    row = dict.fromkeys(SHEET_COLUMNS, "")
+    row.update(
+        NAME="Ann Smith",
+        EMAIL="ann@acme.com",
+        ROLE="CEO",
+        COMPANY="Acme",
+        SOURCE="Hunter.io",
+        DATE="2026-01-01",
+        STATUS="Pending",
+    )
+    row.update(values)
+    return row
+
+
+class FakeWebhook:
+    """
+    Apps Script stand-in on an ephemeral port. Each POST takes the next
+    (delay_seconds, status, headers) from `responses`, then 200 + ok.
+    """
+
+    def __init__(self, responses: List[Tuple[float, int, Dict[str, str]]]):
+        self.responses = list(responses)
+        self.posts = 0
+        webhook = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers["Content-Length"]))
+                webhook.posts += 1
+                delay, status, headers = (
+                    webhook.responses.pop(0) if webhook.responses else (0, 200, {})
+                )
+                time.sleep(delay)
+                try:
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(b'{"status": "ok"}')
+                except OSError:
+                    pass  # client already gave up
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}/exec"
+
+    def __enter__(self) -> "FakeWebhook":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class PostBatchTest(unittest.TestCase):
+    def post(self, webhook: FakeWebhook) -> bool:
+        syncer = SheetSync(webhook.url)
+        self.addCleanup(syncer.session.close)
+        return syncer._post_batch([sheet_row(EMAIL="")])
+
+    def test_read_timeout_is_not_replayed(self):
+        # The webhook got the POST and may have applied it; a replay would
+        # insert the blank-email row twice
+        with mock.patch.object(sheet_sync, "POST_TIMEOUT", 0.2):
+            with FakeWebhook([(0.6, 200, {})]) as webhook:
+                ok = self.post(webhook)
+
+        self.assertFalse(ok)
+        self.assertEqual(webhook.posts, 1)
+
+    def test_429_is_retried_by_post_batch_only(self):
+        rate_limited = (0, 429, {"Retry-After": "0"})
+
+        # Recovers on _post_batch's last attempt
+        with FakeWebhook([rate_limited] * (sheet_sync.RETRIES - 1)) as webhook:
+            self.assertTrue(self.post(webhook))
+        self.assertEqual(webhook.posts, sheet_sync.RETRIES)
+
+        # One request per attempt: the adapter does not retry 429 on its own
+        with FakeWebhook([rate_limited] * sheet_sync.RETRIES) as webhook:
+            self.assertFalse(self.post(webhook))
+        self.assertEqual(webhook.posts, sheet_sync.RETRIES)
+
+
+class ChangeBatchesTest(unittest.TestCase):
+    def plan(self, local: List[Dict[str, Any]], sheet: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        df_local = pd.DataFrame(local, columns=SHEET_COLUMNS)
+        df_sheet = pd.DataFrame(sheet, columns=SHEET_COLUMNS if sheet else None)
+        syncer = SheetSync("http://127.0.0.1:9")
+        self.addCleanup(syncer.session.close)
+        return [row for batch in syncer._iter_change_batches(df_local, df_sheet) for row in batch]
+
+    def test_repeated_email_keeps_last_local_row(self):
+        local = [
+            sheet_row(ROLE="Intern"),
+            sheet_row(EMAIL=" ANN@acme.com ", ROLE="CEO"),
+            sheet_row(EMAIL="", NAME="No Email 1"),
+            sheet_row(EMAIL="", NAME="No Email 2"),
+        ]
+        for sheet in ([], [sheet_row(EMAIL="bob@acme.com")]):
+            rows = self.plan(local, sheet)
+
+            self.assertEqual(
+                [(r["EMAIL"], r["ROLE"], r["NAME"]) for r in rows],
+                [
+                    (" ANN@acme.com ", "CEO", "Ann Smith"),
+                    ("", "CEO", "No Email 1"),
+                    ("", "CEO", "No Email 2"),
+                ],
+            )
+
+    def test_unchanged_rows_are_skipped(self):
+        sheet = [
+            sheet_row(DATE="2025-12-01", STATUS="Sent"),
+            sheet_row(EMAIL="bob@acme.com", NAME="Bob Jones", STATUS="Sent"),
+        ]
+        local = [
+            # Same backend content; only DATE differs, NOTES null vs ""
+            sheet_row(NOTES=None),
+            # Changed ROLE: update, keeping the sheet's workflow STATUS
+            sheet_row(EMAIL="bob@acme.com", NAME="Bob Jones", ROLE="CTO"),
+            sheet_row(EMAIL="cy@acme.com", NAME="Cy Other"),
+        ]
+        rows = self.plan(local, sheet)
+
+        self.assertEqual(
+            [(r["EMAIL"], r["ROLE"], r["STATUS"]) for r in rows],
+            [("bob@acme.com", "CTO", "Sent"), ("cy@acme.com", "CEO", "Pending")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()